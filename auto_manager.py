@@ -19,6 +19,7 @@ Usage:
 import sys
 import os
 import json
+import re
 import time
 
 # Add core to path
@@ -26,6 +27,15 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'core'))
 from binance_client import BinanceClient
 from config import Config
 
+# Session names in `screen -list` output ("\t12345.bot_7\t(Detached)")
+SESSION_RE = re.compile(r'^\s+\d+\.(\S+)', re.MULTILINE)
+
+def screen_sessions():
+    """Names of the live screen sessions"""
+    import subprocess
+    output = subprocess.run(['screen', '-list'], capture_output=True, text=True).stdout
+    return frozenset(SESSION_RE.findall(output))
+
 def get_wallet_coins(client):
     """Get all non-zero coin balances from wallet"""
     try:
@@ -65,9 +75,11 @@ def load_active_bots():
         return json.load(f)
 
 def save_active_bots(bots):
-    """Save bots to active_bots.json"""
-    with open('active_bots.json', 'w') as f:
-        json.dump(bots, f, indent=2)
+    """Save bots to active_bots.json (one write to a temp file, then an atomic rename)"""
+    data = json.dumps(bots, indent=2)
+    with open('active_bots.json.tmp', 'w') as f:
+        f.write(data)
+    os.replace('active_bots.json.tmp', 'active_bots.json')
 
 def create_bot_for_coin(coin, bots, trade_amount=25):
     """Create a bot for a coin if it doesn't exist"""
@@ -119,8 +131,8 @@ def start_bot(bot_id, bot_name, symbol, strategy, trade_amount):
         time.sleep(1)
         
         # Verify it started
-        check = subprocess.run(['screen', '-list'], capture_output=True, text=True)
-        if f'bot_{bot_id}' in check.stdout:
+        # Exact name match: a substring test would take bot_10 for bot_1
+        if f'bot_{bot_id}' in screen_sessions():
             print(f"✅ Started bot {bot_id} for {symbol}")
             return True
         else:
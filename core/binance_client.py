@@ -30,7 +30,7 @@ class BinanceClient:
     complex API details. Perfect for automated trading bots.
     """
     
-    def __init__(self, api_key, api_secret, testnet=False):
+    def __init__(self, api_key, api_secret, testnet=False, request_timeout=None):
         """
         Connect to Binance
         
@@ -38,6 +38,8 @@ class BinanceClient:
             api_key (str): Your Binance API key
             api_secret (str): Your Binance API secret key
             testnet (bool): If True, use fake money for testing. If False, real trading!
+            request_timeout (float): Optional HTTP timeout in seconds for every
+                request (python-binance's default is 10)
         
         Example:
             client = BinanceClient(
@@ -51,7 +53,8 @@ class BinanceClient:
         self.testnet = testnet
         
         try:
-            self.client = Client(api_key, api_secret, testnet=testnet)
+            requests_params = {'timeout': request_timeout} if request_timeout else None
+            self.client = Client(api_key, api_secret, testnet=testnet, requests_params=requests_params)
             if testnet:
                 self.client.API_URL = 'https://testnet.binance.vision/api'
             
@@ -171,6 +171,10 @@ class BotRunner:
         self.position_file = f'bot_{self.bot_id}_position.json'
         self._load_position()
         
+        # Trade stats for the dashboard (read instead of parsing the log)
+        self.stats_file = f'bot_{self.bot_id}.stats.json'
+        self.stats = self._load_stats()
+        
         # Check for orphaned coins in wallet
         self._check_orphaned_positions()
     
@@ -277,9 +281,69 @@ class BotRunner:
         except Exception as e:
             self.logger.error(f"Error deleting position file: {e}")
     
+    def _load_stats(self):
+        """Load the dashboard stats file, so totals survive restarts"""
+        stats = {
+            'last_profit': None,
+            'cum_profit': 0.0,
+            'trades': 0,
+            'last_check': None,
+            'profit_history': [],
+            # [epoch ms, cumulative profit] per trade, for the profit chart
+            'profit_series': []
+        }
+        try:
+            import json
+            with open(self.stats_file, 'r') as f:
+                saved = json.load(f)
+            stats.update(saved)
+            if 'profit_series' not in saved:
+                # Written by an older version: start the series from the
+                # trades it does have
+                total = stats['cum_profit'] - sum(t['profit'] for t in stats['profit_history'])
+                for trade in stats['profit_history']:
+                    total += trade['profit']
+                    ts = datetime.strptime(trade['time'], '%Y-%m-%d %H:%M:%S').timestamp()
+                    stats['profit_series'].append([int(ts * 1000), round(total, 8)])
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.error(f"Error loading stats: {e}")
+        return stats
+    
+    def _save_stats(self):
+        """Write the dashboard stats file (atomic rename - it is read live)"""
+        try:
+            import json
+            data = json.dumps(self.stats)
+            with open(self.stats_file + '.tmp', 'w') as f:
+                f.write(data)
+            os.replace(self.stats_file + '.tmp', self.stats_file)
+        except Exception as e:
+            self.logger.error(f"Error saving stats: {e}")
+    
+    def _record_trade(self, profit):
+        """Add a closed trade to the dashboard stats"""
+        now = datetime.now()
+        self.stats['last_profit'] = profit
+        self.stats['cum_profit'] += profit
+        self.stats['trades'] += 1
+        self.stats['profit_history'].append({
+            'time': now.strftime('%Y-%m-%d %H:%M:%S'),
+            'profit': profit
+        })
+        # Same window the dashboard shows
+        self.stats['profit_history'] = self.stats['profit_history'][-50:]
+        # Every trade for the chart (the dashboard downsamples it), capped
+        # so the file stays small (~125 KB)
+        self.stats['profit_series'].append([int(now.timestamp() * 1000), round(self.stats['cum_profit'], 8)])
+        self.stats['profit_series'] = self.stats['profit_series'][-5000:]
+        self._save_stats()
+    
     def _update_bot_symbol(self, new_symbol):
         """Update bot's symbol in active_bots.json when AI switches coins"""
         try:
+            import json
             bots_file = 'active_bots.json'
             if os.path.exists(bots_file):
                 with open(bots_file, 'r') as f:
@@ -292,9 +356,12 @@ class BotRunner:
                         self.logger.info(f"✅ Updated bot config: {self.bot_name} → {new_symbol}")
                         break
                 
-                # Save updated config
-                with open(bots_file, 'w') as f:
-                    json.dump(bots, f, indent=2)
+                # Save updated config (one write, then an atomic rename so
+                # the dashboard never reads a half-written file)
+                data = json.dumps(bots, indent=2)
+                with open(bots_file + '.tmp', 'w') as f:
+                    f.write(data)
+                os.replace(bots_file + '.tmp', bots_file)
         except Exception as e:
             self.logger.error(f"Error updating bot symbol: {e}")
     
@@ -697,6 +764,7 @@ class BotRunner:
                         self.entry_price = None
                         self.trades_count += 1
                         self.profit_total += profit
+                        self._record_trade(profit)
                         
                         # CLEAR POSITION FILE (no longer in position)
                         self._clear_position_file()
@@ -895,6 +963,10 @@ class BotRunner:
                 if signal in ['BUY', 'SELL']:
                     self.execute_trade(signal, current_price, signal_data)
                 
+                # Let the dashboard know this bot is still checking
+                self.stats['last_check'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                self._save_stats()
+                
                 # Check if 6 hours passed and send summary
                 self.check_and_send_summary()
                 
@@ -15,10 +15,12 @@ import os
 sys.path.insert(0, os.path.dirname(__file__))
 
 from datetime import datetime, timedelta
-import requests
-from typing import List, Dict, Tuple
+import asyncio
+import httpx
+from typing import List, Dict, Tuple, Optional
 import json
 from itertools import product
+import numpy as np
 
 # Expanded coin list for more testing
 TEST_COINS = [
@@ -28,6 +30,58 @@ TEST_COINS = [
     'APE', 'CRV', 'LDO', 'OP', 'ARB'  # Added more coins
 ]
 
+# Max concurrent kline downloads (keeps us well under Binance rate limits)
+FETCH_CONCURRENCY = 8
+
+def klines_to_arrays(klines: List[dict]) -> Dict[str, np.ndarray]:
+    """
+    Convert kline dicts into column arrays (struct-of-arrays).
+
+    Prices and volume are stored as float32 - Binance precision fits easily
+    and it halves the bytes scanned by the momentum pass. Timestamps stay int64 (ms).
+    """
+    return {
+        'timestamp': np.array([int(k['timestamp'].timestamp() * 1000) for k in klines], dtype=np.int64),
+        'open': np.array([k['open'] for k in klines], dtype=np.float32),
+        'high': np.array([k['high'] for k in klines], dtype=np.float32),
+        'low': np.array([k['low'] for k in klines], dtype=np.float32),
+        'close': np.array([k['close'] for k in klines], dtype=np.float32),
+        'volume': np.array([k['volume'] for k in klines], dtype=np.float32),
+    }
+
+
+def calculate_momentum_scores(arrays: Dict[str, np.ndarray]) -> np.ndarray:
+    """
+    Vectorized version of MomentumBacktester.calculate_momentum_score for every index.
+
+    The score doesn't depend on the strategy config, so it is computed once per coin
+    and shared by all configurations. Ratios are computed in float32; the rolling
+    volume sum and the final score are promoted to float64 to avoid drift.
+    """
+    closes = arrays['close']
+    volumes = arrays['volume']
+    n = len(closes)
+    scores = np.full(n, 50.0, dtype=np.float64)
+    if n <= 24:
+        return scores
+    
+    # Same window as calculate_momentum_score: klines[index-24:index+1]
+    cur = closes[24:]
+    change_1h = (cur - closes[23:-1]) / closes[23:-1] * np.float32(100)
+    change_24h = (cur - closes[:-24]) / closes[:-24] * np.float32(100)
+    
+    # Average volume over the 24 candles before the current one
+    csum = np.concatenate(([0.0], np.cumsum(volumes, dtype=np.float64)))
+    avg_volume = (csum[24:n] - csum[0:n - 24]) / 24
+    safe_avg = np.where(avg_volume > 0, avg_volume, 1.0)
+    volume_ratio = np.where(avg_volume > 0, volumes[24:] / safe_avg, 1.0)
+    
+    score = 50 + change_1h.astype(np.float64) * 2 + change_24h.astype(np.float64) * 0.5
+    score += np.where(volume_ratio > 1.5, 10, 0)
+    scores[24:] = np.clip(score, 0, 100)
+    return scores
+
+
 class Trade:
     def __init__(self, coin: str, entry_price: float, entry_time: datetime, 
                  entry_sentiment: float, investment: float = 1000):
@@ -81,11 +135,13 @@ class StrategyConfig:
         self.trailing_days = trailing_days
         self.trailing_profit_pct = trailing_profit_pct
         self.position_size = position_size
+        # Configs are immutable once built, so format the label only once
+        self._str = (f"M{momentum_threshold:.0f}_SL{stop_loss_pct:.0f}_"
+                     f"T{trailing_days}d{trailing_profit_pct:.0f}_"
+                     f"${position_size:.0f}")
     
     def __str__(self):
-        return (f"M{self.momentum_threshold:.0f}_SL{self.stop_loss_pct:.0f}_"
-                f"T{self.trailing_days}d{self.trailing_profit_pct:.0f}_"
-                f"${self.position_size:.0f}")
+        return self._str
 
 
 class MomentumBacktester:
@@ -97,8 +153,14 @@ class MomentumBacktester:
         self.closed_trades: List[Trade] = []
         self.cache = {}  # Cache historical data
         
-    def fetch_historical_klines(self, coin: str, days: int = 365) -> List[dict]:
-        """Fetch historical OHLCV data from Binance (with caching)"""
+    async def fetch_historical_klines(self, client: httpx.AsyncClient, coin: str,
+                                      days: int = 365) -> List[dict]:
+        """
+        Fetch historical OHLCV data from Binance (with caching)
+
+        client: shared httpx.AsyncClient so every coin and every page reuses
+        the same HTTP/2 connection instead of a new TLS handshake per request
+        """
         if coin in self.cache:
             return self.cache[coin]
         
@@ -122,7 +184,7 @@ class MomentumBacktester:
         try:
             while current_start < end_time:
                 params['startTime'] = int(current_start.timestamp() * 1000)
-                response = requests.get(url, params=params, timeout=10)
+                response = await client.get(url, params=params, timeout=10)
                 
                 if response.status_code == 200:
                     klines = response.json()
@@ -178,8 +240,13 @@ class MomentumBacktester:
         score = max(0, min(100, score))
         return score
     
-    def run_backtest(self, coin: str, klines: List[dict]) -> int:
-        """Run backtest for a single coin, return number of trades"""
+    def run_backtest(self, coin: str, klines: List[dict],
+                     momentum_scores: Optional[np.ndarray] = None) -> int:
+        """
+        Run backtest for a single coin, return number of trades
+
+        momentum_scores: optional precomputed scores (see calculate_momentum_scores)
+        """
         trades_count = 0
         
         for i, kline in enumerate(klines):
@@ -205,7 +272,10 @@ class MomentumBacktester:
             
             # Check for entry signals
             elif self.cash >= self.config.position_size:
-                momentum = self.calculate_momentum_score(klines, i)
+                if momentum_scores is not None:
+                    momentum = momentum_scores[i]
+                else:
+                    momentum = self.calculate_momentum_score(klines, i)
                 
                 if momentum >= self.config.momentum_threshold:
                     trade = Trade(coin, current_price, current_time, momentum, self.config.position_size)
@@ -255,6 +325,19 @@ class MomentumBacktester:
         }
 
 
+async def fetch_all_klines(backtester: MomentumBacktester, coins: List[str],
+                           days: int = 365) -> list:
+    """Download klines for all coins concurrently over one HTTP/2 client"""
+    semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+    
+    async with httpx.AsyncClient(http2=True) as client:
+        async def fetch(coin):
+            async with semaphore:
+                return await backtester.fetch_historical_klines(client, coin, days=days)
+        
+        return await asyncio.gather(*[fetch(coin) for coin in coins], return_exceptions=True)
+
+
 def optimize_strategy():
     """Test multiple strategy configurations"""
     print("="*100)
@@ -284,14 +367,19 @@ def optimize_strategy():
     # Fetch all historical data first (with progress)
     print("📥 Fetching historical data for all coins...")
     global_cache = {}
+    global_scores = {}
     valid_coins = []
     
-    for i, coin in enumerate(TEST_COINS, 1):
+    dummy_backtester = MomentumBacktester(all_configs[0])
+    fetched = asyncio.run(fetch_all_klines(dummy_backtester, TEST_COINS, days=365))
+    
+    for i, (coin, klines) in enumerate(zip(TEST_COINS, fetched), 1):
         try:
-            dummy_backtester = MomentumBacktester(all_configs[0])
-            klines = dummy_backtester.fetch_historical_klines(coin, days=365)
+            if isinstance(klines, Exception):
+                raise klines
             if klines and len(klines) > 1000:  # Need sufficient data
                 global_cache[coin] = klines
+                global_scores[coin] = calculate_momentum_scores(klines_to_arrays(klines))
                 valid_coins.append(coin)
                 print(f"   [{i:2d}/{len(TEST_COINS)}] ✅ {coin:8s} {len(klines):5d} data points")
             else:
@@ -311,7 +399,7 @@ def optimize_strategy():
         total_trades = 0
         for coin in valid_coins:
             klines = global_cache[coin]
-            trades = backtester.run_backtest(coin, klines)
+            trades = backtester.run_backtest(coin, klines, global_scores[coin])
             total_trades += trades
         
         result = backtester.get_results()
@@ -5,6 +5,11 @@ Simple script: Scrape BNB posts from Binance Square and make AI trading decision
 
 import sys
 import os
+import re
+import json
+import time
+import hashlib
+import asyncio
 sys.path.insert(0, os.path.dirname(__file__))
 
 from app.binance_square_scraper import BinanceSquareScraper
@@ -14,29 +19,82 @@ from datetime import datetime
 
 load_dotenv()
 
-def analyze_with_ai(articles):
-    """
-    Feed articles to OpenAI and get trading decision
-    Returns: {'decision': 'BUY/SELL/HOLD', 'score': 0-100, 'reasoning': str}
-    """
-    
-    # Prepare content for AI
-    articles_text = ""
+# Field extraction for a streamed or truncated JSON answer (compiled once).
+# "decision" is requested first so it can be acted on before the rest arrives.
+_JSON_DECISION_RE = re.compile(r'"decision"\s*:\s*"([^"]*)"')
+# The score needs its terminator: a stream cut off mid-number ("score": 4
+# of 42) must fall back to the default rather than yield the wrong number.
+_JSON_SCORE_RE = re.compile(r'"score"\s*:\s*"?(\d+)"?\s*[,}]')
+
+# Prompt size limits: each post is cut to ARTICLE_CHAR_LIMIT and the posts
+# for one coin stop once PROMPT_CHAR_BUDGET characters have been used
+ARTICLE_CHAR_LIMIT = 500
+PROMPT_CHAR_BUDGET = 8000
+
+# Lazily-created OpenAI client, shared so the connection pool is reused
+_CLIENT = None
+
+def _get_client():
+    """Return the shared OpenAI client (created on first use)"""
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = openai.OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+    return _CLIENT
+
+# Recent decisions keyed by article set, so an unchanged scrape skips the LLM.
+# TTL matches the 15-minute scrape window.
+_DECISION_CACHE = {}
+_CACHE_TTL = 15 * 60
+
+def _articles_key(articles):
+    """Stable hash of an article set (URL + the content we actually send)"""
+    entries = sorted(
+        f"{art.get('url', '')}\0{art.get('content', '')[:ARTICLE_CHAR_LIMIT]}".encode()
+        for art in articles
+    )
+    return hashlib.blake2b(b"|".join(entries), digest_size=16).hexdigest()
+
+
+def _cache_get(key):
+    hit = _DECISION_CACHE.get(key)
+    if hit and time.monotonic() - hit[0] < _CACHE_TTL:
+        return dict(hit[1])
+    return None
+
+
+def _cache_put(key, result):
+    now = time.monotonic()
+    for k in [k for k, (ts, _) in _DECISION_CACHE.items() if now - ts >= _CACHE_TTL]:
+        del _DECISION_CACHE[k]
+    _DECISION_CACHE[key] = (now, dict(result))
+
+
+def _posts_text(articles):
+    """Format posts for the prompt, capped at PROMPT_CHAR_BUDGET characters"""
+    parts = []
+    total = 0
     for i, art in enumerate(articles, 1):
-        content = art.get('content', '')[:500]  # Limit each article
-        articles_text += f"\n\n--- Post {i} ---\n{content}"
+        content = art.get('content', '')[:ARTICLE_CHAR_LIMIT]  # Limit each article
+        total += len(content)
+        if total > PROMPT_CHAR_BUDGET:
+            break
+        parts.append(f"\n\n--- Post {i} ---\n{content}")
+    return ''.join(parts)
+
+
+def _build_prompt(articles):
+    """Build the sentiment prompt for a list of scraped articles"""
+    articles_text = _posts_text(articles)
     
-    prompt = f"""You are a crypto trading AI analyzing recent Binance Square posts about BNB.
+    return f"""You are a crypto trading AI analyzing recent Binance Square posts about BNB.
 
 RECENT POSTS FROM BINANCE SQUARE (last 15 minutes):
 {articles_text}
 
 Based on the SENTIMENT and ENTHUSIASM in these posts, provide a trading recommendation.
 
-Respond in this EXACT format:
-DECISION: [BUY/SELL/HOLD]
-SCORE: [0-100 where 0=extremely bearish, 50=neutral, 100=extremely bullish]
-REASONING: [One paragraph explanation]
+Respond with ONLY a JSON object in this EXACT shape (keys in this order):
+{{"decision": "BUY|SELL|HOLD", "score": <0-100 where 0=extremely bearish, 50=neutral, 100=extremely bullish>, "reasoning": "<2-3 sentence explanation>"}}
 
 Consider:
 - Positive/bullish language → Higher score, potentially BUY
@@ -45,60 +103,231 @@ Consider:
 - Look for actual trading sentiment, not just generic mentions
 """
 
+
+def _completion_kwargs(prompt):
+    """Arguments for chat.completions.create (shared by sync and async paths)"""
+    return dict(
+        model="gpt-4o-mini",
+        messages=[
+            {"role": "system", "content": "You are a crypto trading analyst."},
+            {"role": "user", "content": prompt}
+        ],
+        # Fixed-format structured output: low temperature, small token budget
+        temperature=0.2,
+        max_tokens=200,
+        response_format={"type": "json_object"}
+    )
+
+
+def _decision_from_row(row, raw):
+    """Normalize one {decision, score, reasoning} object from the model"""
     try:
-        client = openai.OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
-        
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": "You are a crypto trading analyst."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=500
-        )
-        
-        result = response.choices[0].message.content
-        
-        # Parse response
-        lines = result.strip().split('\n')
-        decision = "HOLD"
+        score = int(row.get('score', 50))
+    except (TypeError, ValueError):
         score = 50
-        reasoning = ""
-        
-        for line in lines:
-            if line.startswith('DECISION:'):
-                decision = line.split(':', 1)[1].strip()
-            elif line.startswith('SCORE:'):
-                score_text = line.split(':', 1)[1].strip()
-                # Extract number from text like "75" or "75/100"
-                import re
-                score_match = re.search(r'(\d+)', score_text)
-                if score_match:
-                    score = int(score_match.group(1))
-            elif line.startswith('REASONING:'):
-                reasoning = line.split(':', 1)[1].strip()
-        
-        # Get remaining reasoning if multiline
-        if 'REASONING:' in result:
-            reasoning_start = result.index('REASONING:') + len('REASONING:')
-            reasoning = result[reasoning_start:].strip()
-        
-        return {
-            'decision': decision,
-            'score': score,
-            'reasoning': reasoning,
-            'raw_response': result
-        }
+    return {
+        'decision': str(row.get('decision') or 'HOLD').strip().upper(),
+        'score': score,
+        'reasoning': str(row.get('reasoning', '')).strip(),
+        'raw_response': raw
+    }
+
+
+def _parse_response(result):
+    """
+    Turn the raw model output (JSON) into a decision dict
+    
+    Returns (decision dict, clean). clean is False when anything had to be
+    salvaged or defaulted; only clean results are worth caching.
+    """
+    clean = True
+    try:
+        row = json.loads(result)
+        if not isinstance(row, dict):
+            row, clean = {}, False
+    except ValueError:
+        # Cut short (max_tokens or an early stop) - salvage what we can
+        row, clean = {}, False
+        match = _JSON_DECISION_RE.search(result)
+        if match:
+            row['decision'] = match.group(1)
+        match = _JSON_SCORE_RE.search(result)
+        if match:
+            row['score'] = match.group(1)
+    
+    decision = _decision_from_row(row, result)
+    if clean:
+        try:
+            int(row['score'])
+            clean = decision['decision'] in ('BUY', 'SELL', 'HOLD')
+        except (KeyError, TypeError, ValueError):
+            clean = False
+    return decision, clean
+
+
+def _error_result(e):
+    print(f"❌ OpenAI Error: {e}")
+    return {
+        'decision': 'HOLD',
+        'score': 50,
+        'reasoning': f'Error getting AI decision: {e}',
+        'raw_response': ''
+    }
+
+
+def _read_stream(stream, on_decision=None):
+    """
+    Accumulate a streamed completion
+    
+    on_decision(decision) is called as soon as the "decision" field is
+    complete, before score/reasoning arrive. If it returns False the rest of the
+    stream is dropped.
+    Returns (text, complete)
+    """
+    parts = []
+    notified = on_decision is None
+    
+    for chunk in stream:
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta.content
+        if not delta:
+            continue
+        parts.append(delta)
         
+        if not notified and '"' in delta:
+            text = ''.join(parts)
+            match = _JSON_DECISION_RE.search(text)
+            if match:
+                notified = True
+                if on_decision(match.group(1).strip().upper()) is False:
+                    stream.close()
+                    return text, False
+    
+    return ''.join(parts), True
+
+
+def analyze_with_ai(articles, on_decision=None):
+    """
+    Feed articles to OpenAI and get trading decision
+    Returns: {'decision': 'BUY/SELL/HOLD', 'score': 0-100, 'reasoning': str}
+    
+    The completion is streamed: on_decision (optional) gets the decision as
+    soon as it arrives and can return False to skip the rest (e.g. on HOLD).
+    A result cut short that way keeps the score only if it had fully
+    arrived in the same chunk; otherwise the score is the neutral 50.
+    Results are cached for 15 minutes per article set (errors, cut-short and
+    unparseable responses are not cached).
+    """
+    key = _articles_key(articles)
+    cached = _cache_get(key)
+    if cached:
+        if on_decision:
+            on_decision(cached['decision'])
+        return cached
+    
+    prompt = _build_prompt(articles)
+    
+    try:
+        stream = _get_client().chat.completions.create(stream=True, **_completion_kwargs(prompt))
+        text, complete = _read_stream(stream, on_decision)
+        result, clean = _parse_response(text)
+    except Exception as e:
+        return _error_result(e)
+    
+    if complete and clean:
+        _cache_put(key, result)
+    return result
+
+
+async def analyze_with_ai_async(articles, client):
+    """
+    Async version of analyze_with_ai
+    
+    client: an openai.AsyncOpenAI instance (shared across concurrent calls)
+    """
+    key = _articles_key(articles)
+    cached = _cache_get(key)
+    if cached:
+        return cached
+    
+    prompt = _build_prompt(articles)
+    
+    try:
+        response = await client.chat.completions.create(**_completion_kwargs(prompt))
+        result, clean = _parse_response(response.choices[0].message.content)
     except Exception as e:
-        print(f"❌ OpenAI Error: {e}")
-        return {
-            'decision': 'HOLD',
-            'score': 50,
-            'reasoning': f'Error getting AI decision: {e}',
-            'raw_response': ''
-        }
+        return _error_result(e)
+    
+    if clean:
+        _cache_put(key, result)
+    return result
+
+
+async def analyze_many(article_lists, client=None):
+    """
+    Analyze several article sets concurrently (e.g. one per symbol)
+    
+    The HTTP round trips overlap instead of running back to back.
+    Returns a list of decision dicts in the same order as article_lists.
+    """
+    client = client or openai.AsyncOpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+    return await asyncio.gather(*[analyze_with_ai_async(a, client) for a in article_lists])
+
+
+def _build_multi_prompt(articles_by_symbol):
+    """Build one prompt covering several symbols, one numbered section each"""
+    sections = []
+    for n, (symbol, articles) in enumerate(articles_by_symbol.items(), 1):
+        sections.append(f"\n\n=== {n}. {symbol} ==={_posts_text(articles)}")
+    
+    return f"""You are a crypto trading AI analyzing recent Binance Square posts for several coins.
+
+RECENT POSTS FROM BINANCE SQUARE (last 15 minutes), grouped by coin:
+{"".join(sections)}
+
+For EACH coin, based on the SENTIMENT and ENTHUSIASM in its posts, provide a trading recommendation.
+
+Respond with a JSON object in this EXACT shape:
+{{"results": [{{"symbol": "<coin>", "decision": "BUY|SELL|HOLD", "score": <0-100 where 0=extremely bearish, 50=neutral, 100=extremely bullish>, "reasoning": "<2-3 sentence explanation>"}}]}}
+
+Consider:
+- Positive/bullish language → Higher score, potentially BUY
+- Negative/bearish language → Lower score, potentially SELL  
+- Mixed or low enthusiasm → HOLD
+- Look for actual trading sentiment, not just generic mentions
+"""
+
+
+def analyze_symbols_with_ai(articles_by_symbol):
+    """
+    Get trading decisions for several coins in a single OpenAI call
+    
+    articles_by_symbol: {'BNB': [articles], 'BTC': [articles], ...}
+    Returns: {symbol: {'decision', 'score', 'reasoning', 'raw_response'}}
+    
+    One round trip and one system prompt instead of one completion per coin.
+    Coins missing from the model's answer default to HOLD/50.
+    """
+    if not articles_by_symbol:
+        return {}
+    
+    kwargs = _completion_kwargs(_build_multi_prompt(articles_by_symbol))
+    kwargs['max_tokens'] = 200 * len(articles_by_symbol)
+    
+    try:
+        response = _get_client().chat.completions.create(**kwargs)
+        result = response.choices[0].message.content
+        rows = json.loads(result).get('results', [])
+    except Exception as e:
+        error = _error_result(e)
+        return {symbol: dict(error) for symbol in articles_by_symbol}
+    
+    by_symbol = {str(row.get('symbol', '')).upper(): row for row in rows if isinstance(row, dict)}
+    return {
+        symbol: _decision_from_row(by_symbol.get(symbol.upper(), {}), result)
+        for symbol in articles_by_symbol
+    }
 
 
 def main():
@@ -13,13 +13,14 @@ What it does:
 
 How to use:
 1. Run: python3 simple_dash.py
+   (or in production: gunicorn -k gevent -w 1 -b 0.0.0.0:5001 wsgi:application)
 2. Open browser: http://localhost:5001
 3. Click "Add Coin" to create a new bot
 4. Start the bot and watch it trade!
 
 Features:
 - Beautiful web interface
-- Real-time updates every 30 seconds
+- Live updates (WebSocket push, or polling without flask-sock)
 - Countdown timers showing when bots will check next
 - Profit charts for each bot
 - Search trending coins on Binance
@@ -27,11 +28,21 @@ Features:
 Author: Trading Bot
 """
 
-from flask import Flask, jsonify, request
+from flask import Flask, Response, request, send_from_directory, stream_with_context
+import getpass
+import gzip
+import hashlib
+import heapq
 import json
+import mmap
 import os
+import re
 import subprocess
+import threading
+import requests
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 # Import our core modules from the core/ folder
@@ -45,7 +56,204 @@ except ImportError:
     from binance_client import BinanceClient
     from config import Config
 
+# orjson is optional - it's a much faster encoder for the polled JSON routes
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Flask-Compress is optional too - without it, JSON and the page are gzipped
+# by hand below
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
+
+# flask-sock is optional as well - it adds the /ws/dashboard push channel;
+# without it the page simply keeps polling /api/overview
+try:
+    from flask_sock import Sock
+except ImportError:
+    Sock = None
+
+# brotli is optional - when present, clients that accept it get br instead
+# of gzip (smaller for the same CPU on repetitive JSON)
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# inotify_simple is optional (Linux) - start_bot then wakes on screen socket
+# changes instead of re-checking on a short timer
+try:
+    import inotify_simple
+except ImportError:
+    inotify_simple = None
+
 app = Flask(__name__)
+if Compress is not None:
+    Compress(app)
+sock = Sock(app) if Sock is not None else None
+
+GZIP_MIN_SIZE = 500  # bytes; smaller bodies aren't worth compressing
+
+# The bots are started from (and write their logs, positions and the
+# registry to) the directory this file is in, whatever the dashboard's
+# working directory is
+BASE_DIR = os.path.abspath(os.path.dirname(__file__))
+
+
+def bot_log_path(bot_id):
+    return f'{BASE_DIR}/bot_{bot_id}.log'
+
+
+def bot_position_path(bot_id):
+    return f'{BASE_DIR}/bot_{bot_id}_position.json'
+
+
+def bot_stats_path(bot_id):
+    # Written by integrated_trader.py on every trade / check
+    return f'{BASE_DIR}/bot_{bot_id}.stats.json'
+
+# Chart.js and its date adapter are served from static/vendor/ when present
+# (start.sh downloads them), so the page doesn't wait on a third-party CDN.
+# File names carry the version, which lets browsers cache them forever.
+VENDOR_DIR = os.path.join(app.static_folder, 'vendor')
+VENDOR_SCRIPTS = {
+    'chart-4.4.0.umd.min.js':
+        'https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js',
+    'chartjs-adapter-date-fns-3.0.0.bundle.min.js':
+        'https://cdn.jsdelivr.net/npm/chartjs-adapter-date-fns@3.0.0/dist/chartjs-adapter-date-fns.bundle.min.js',
+}
+
+LOG_TAIL_BYTES = 64 * 1024  # enough for the last 20 log lines
+LOG_READ_CHUNK = 1024 * 1024  # new log bytes parsed per read
+LOG_MMAP_MIN = 8 * 1024 * 1024  # backlogs this big are regex-scanned via mmap
+PROFIT_HISTORY_LEN = 50
+DETAILS_LOG_LINES = 20  # default recent_logs length (?logs= for more)
+MAX_LOG_LINES = 500
+MAX_SERIES_POINTS = 500  # profit_series is downsampled to this many points
+
+# Log line patterns, compiled once
+# "<date> <time> ... SELL ... Profit: $+1.23" -> ts, signed profit
+TRADE_RE = re.compile(r'^(?P<ts>\S+\s+\S+)\s.*?SELL.*?Profit:\s*\$?\+?(?P<profit>-?\d+(?:\.\d+)?)')
+# "<date> <time> ... Signal: ..." / "... Generating signal ..." -> ts
+SIGNAL_RE = re.compile(r'^(?P<ts>\S+\s+\S+).*?(?:Signal:|Generating signal)')
+# Any line starting "YYYY-MM-DD HH:MM:SS..." -> ts
+LOG_TIME_RE = re.compile(r'^(?P<ts>\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}\S*)')
+# Trade candidates in a mapped log: starts at the literal so the regex engine
+# can skip ahead; each hit's line is then checked with TRADE_RE
+TRADE_HINT_RE = re.compile(rb'SELL[^\n]*?Profit:')
+
+
+def downsample_lttb(points, threshold):
+    """
+    Largest-Triangle-Three-Buckets: at most `threshold` of the (x, y) points
+    
+    Keeps the first and last point and, from each bucket in between, the
+    point forming the largest triangle with its neighbours - the shape of
+    the line survives far better than with plain striding.
+    """
+    n = len(points)
+    if threshold >= n or threshold < 3:
+        return list(points)
+    
+    sampled = [points[0]]
+    every = (n - 2) / (threshold - 2)
+    a = 0
+    for i in range(threshold - 2):
+        # Average of the next bucket is the triangle's third corner
+        next_start = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        bucket = points[next_start:next_end]
+        avg_x = sum(p[0] for p in bucket) / len(bucket)
+        avg_y = sum(p[1] for p in bucket) / len(bucket)
+        
+        ax, ay = points[a]
+        best, best_area = a + 1, -1.0
+        for j in range(int(i * every) + 1, int((i + 1) * every) + 1):
+            x, y = points[j]
+            area = abs((ax - avg_x) * (y - ay) - (ax - x) * (avg_y - ay))
+            if area > best_area:
+                best, best_area = j, area
+        sampled.append(points[best])
+        a = best
+    sampled.append(points[-1])
+    return sampled
+
+
+def accepts_gzip():
+    return 'gzip' in request.headers.get('Accept-Encoding', '').lower()
+
+
+def response_encoding():
+    """'br', 'gzip' or None - the best encoding this client accepts that we can do"""
+    if brotli is not None and 'br' in request.headers.get('Accept-Encoding', '').lower():
+        return 'br'
+    return 'gzip' if accepts_gzip() else None
+
+
+@app.after_request
+def compress_json(response):
+    """Compress JSON bodies for clients that accept it (when Flask-Compress is absent)"""
+    if (Compress is not None or response.mimetype != 'application/json'
+            or response.status_code != 200 or response.is_streamed
+            or response.direct_passthrough
+            or 'Content-Encoding' in response.headers):
+        return response
+    encoding = response_encoding()
+    if encoding is None:
+        return response
+    body = response.get_data()
+    if len(body) < GZIP_MIN_SIZE:
+        return response
+    if encoding == 'br':
+        # Low quality: nearly gzip's speed, still smaller
+        response.set_data(brotli.compress(body, quality=4))
+    else:
+        response.set_data(gzip.compress(body, 6))
+    response.headers['Content-Encoding'] = encoding
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)  # same content, different bytes
+    response.vary.add('Accept-Encoding')
+    return response
+
+
+def dumps(data):
+    """Compact JSON bytes, via orjson when it is installed"""
+    if orjson is not None:
+        # NON_STR_KEYS: int dict keys become strings, as with json.dumps
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def ojsonify(data):
+    """jsonify() replacement that encodes with orjson when it is installed"""
+    return Response(dumps(data), mimetype='application/json')
+
+
+def iter_json(data):
+    """
+    Encode a dict as JSON piece by piece
+    
+    Top-level list values are emitted one element at a time (nested dicts
+    recurse), so a response never holds the whole encoded body at once.
+    """
+    yield b'{'
+    for n, (key, value) in enumerate(data.items()):
+        yield (b',' if n else b'') + dumps(key) + b':'
+        if isinstance(value, dict):
+            yield from iter_json(value)
+        elif isinstance(value, list):
+            yield b'['
+            for i, item in enumerate(value):
+                yield (b',' if i else b'') + dumps(item)
+            yield b']'
+        else:
+            yield dumps(value)
+    yield b'}'
+
 
 class BotManager:
     """
@@ -61,102 +269,377 @@ class BotManager:
     
     def __init__(self):
         """Initialize the bot manager and connect to Binance"""
-        self.bots_file = 'active_bots.json'
+        self.bots_file = os.path.join(BASE_DIR, 'active_bots.json')
+        self.pid_dir = os.path.join(BASE_DIR, 'pids')  # pids/bot_<id>.pid, written by start_bot
+        
+        # In-memory copy of active_bots.json (write-through via _save_bots).
+        # auto_manager.py / integrated_trader.py also edit the file, so it is
+        # re-read whenever its stat stamp (mtime_ns, size, inode) changes.
+        self._bots = None
+        self._bots_stamp = None
+        self._bots_by_id = {}  # bot id -> position in self._bots
+        self._bots_lock = threading.RLock()  # reload / save of the registry
+        
+        # Per-bot incremental log scan state (see _scan_log); the per-bot
+        # locks keep concurrent requests from parsing the same bytes twice
+        # while different bots' logs are scanned in parallel
+        self._log_state = {}
+        self._log_locks = {}
+        
+        # Parsed stats sidecars: bot id -> (stat stamp, stats)
+        self._stats_cache = {}
+        
+        # Overlaps the log reads of get_all_bot_tails
+        self._io_pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix='log-tail')
+        
+        # Live screen sessions ({name: pid}) and when they were read
+        # (monotonic), so one dashboard refresh fanning out to several
+        # handlers only looks once
+        self._screen_cache = (0.0, {})
+        self.screen_list_ttl = 1.0  # seconds
+        
+        # GNU screen keeps one socket per session ("<pid>.<name>") here;
+        # listing it is a single directory read instead of forking screen
+        self._screen_dir = self._find_screen_dir()
+        
+        # start_bot returns as soon as the new bot's session shows up, and
+        # fails if it hasn't within this long. A bot that dies afterwards is
+        # caught by the PID / screen status probe (get_bots).
+        self.startup_timeout = 2.0  # seconds
         
         # Connect to Binance API
+        # Short timeout: a dead Binance endpoint should degrade the dashboard
+        # quickly rather than stall it for python-binance's default 10s
         self.client = BinanceClient(
             api_key=Config.BINANCE_API_KEY,
             api_secret=Config.BINANCE_API_SECRET,
-            testnet=Config.USE_TESTNET
+            testnet=Config.USE_TESTNET,
+            request_timeout=2
         )
+        
+        # Account balances are refreshed in the background so dashboard
+        # requests never wait on the Binance REST call
+        self.account_refresh_interval = 5  # seconds
+        self._account_snapshot = None
+        self._account_ready = threading.Event()
+        threading.Thread(target=self._account_refresher, daemon=True).start()
+    
+    def _account_refresher(self):
+        """Background loop: keep self._account_snapshot up to date"""
+        while True:
+            snapshot = self.fetch_account_info()
+            if snapshot is not None and snapshot.get('stale'):
+                # Binance unreachable: keep the last balances, flagged as stale
+                snapshot = dict(self._account_snapshot or {}, stale=True)
+            if snapshot is not None:
+                self._account_snapshot = snapshot
+            self._account_ready.set()
+            time.sleep(self.account_refresh_interval)
+    
+    def _registry(self):
+        """The in-memory bot list, loaded from disk only when the file changed"""
+        with self._bots_lock:
+            try:
+                stamp = self._stat_stamp(self.bots_file)
+            except OSError:
+                self._bots, self._bots_stamp = [], None
+                self._index_bots()
+                return self._bots
+            
+            if self._bots is None or stamp != self._bots_stamp:
+                with open(self.bots_file, 'rb') as f:
+                    data = f.read()
+                self._bots = orjson.loads(data) if orjson is not None else json.loads(data)
+                self._bots_stamp = stamp
+                self._index_bots()
+            return self._bots
+    
+    def _index_bots(self):
+        self._bots_by_id = {bot['id']: i for i, bot in enumerate(self._bots)}
+    
+    def _find_bot(self, bots, bot_id):
+        """
+        The entry for bot_id in a list from get_bots(), or None
+        
+        get_bots() keeps registry order, so the id index gives the position
+        directly; the linear scan only runs if the list has since diverged.
+        """
+        pos = self._bots_by_id.get(bot_id)
+        if pos is not None and pos < len(bots) and bots[pos]['id'] == bot_id:
+            return bots[pos]
+        return next((b for b in bots if b['id'] == bot_id), None)
+    
+    @staticmethod
+    def _stat_stamp(path):
+        """
+        Change stamp for a file
+        
+        Nanosecond mtime alone can repeat on filesystems with coarse
+        timestamps; size and inode (new on every atomic replace) catch those.
+        """
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
     
     def get_bots(self):
-        """Load all active bots"""
-        if not os.path.exists(self.bots_file):
-            return []
-        with open(self.bots_file, 'r') as f:
-            bots = json.load(f)
+        """Load all active bots (copies of the registry entries, with live status)"""
+        bots = [dict(bot) for bot in self._registry()]
         
-        # Check actual status
+        # Check actual status: probe the PID file when there is one, and only
+        # fall back to a (single) screen -list for bots started without one
+        running = None
         for bot in bots:
-            result = subprocess.run(['screen', '-list'], capture_output=True, text=True)
-            bot['status'] = 'running' if f'bot_{bot["id"]}' in result.stdout else 'stopped'
+            pid = self._read_pid(bot['id'])
+            if pid is not None:
+                if self._pid_alive(pid) and self._pid_is_screen(pid):
+                    bot['status'] = 'running'
+                    continue
+                # Stale: the session ended, or the bot was relaunched without
+                # a PID file (auto_manager.py, by hand) - ask screen instead
+                self._remove_pid(bot['id'])
+            if running is None:
+                running = self._screen_sessions()
+            bot['status'] = 'running' if f'bot_{bot["id"]}' in running else 'stopped'
         
         return bots
     
+    @staticmethod
+    def _find_screen_dir():
+        """Directory holding this user's screen sockets, or None if unknown"""
+        if os.environ.get('SCREENDIR'):
+            return os.environ['SCREENDIR']
+        user = getpass.getuser()
+        for base in ('/run/screen', '/var/run/screen', '/tmp/screens'):
+            path = os.path.join(base, f'S-{user}')
+            if os.path.isdir(path):
+                return path
+        return None
+    
+    def _screen_sessions(self, fresh=False):
+        """
+        Live screen sessions as {name: pid}
+        
+        Read from the socket directory (falling back to `screen -list` when
+        it can't be found) and reused for screen_list_ttl seconds unless fresh.
+        """
+        ts, sessions = self._screen_cache
+        now = time.monotonic()
+        if not fresh and now - ts < self.screen_list_ttl:
+            return sessions
+        
+        entries = None
+        if self._screen_dir:
+            try:
+                entries = [e.name for e in os.scandir(self._screen_dir)]
+            except OSError:
+                entries = None
+        if entries is None:
+            output = subprocess.run(['screen', '-list'], capture_output=True, text=True).stdout
+            entries = re.findall(r'^\s+(\d+\.\S+)', output, re.MULTILINE)
+        
+        sessions = {}
+        for entry in entries:
+            pid, _, name = entry.partition('.')
+            # Sockets of crashed sessions linger until `screen -wipe`
+            if pid.isdigit() and self._pid_alive(int(pid)):
+                sessions[name] = int(pid)
+        
+        self._screen_cache = (now, sessions)
+        return sessions
+    
+    def _save_bots(self, bots):
+        """
+        Write active_bots.json atomically
+        
+        The list goes to a temp file which then replaces the real one, so a
+        crash mid-write can never leave a truncated file behind. Nothing is
+        written if the list is the same as what's on disk (stopping a bot
+        that is already stopped, saving an unedited bot).
+        """
+        with self._bots_lock:
+            if bots == self._registry():
+                return
+            
+            if orjson is not None:
+                data = orjson.dumps(bots, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(bots, indent=2).encode('utf-8')
+            
+            tmp_file = self.bots_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_file, self.bots_file)
+            
+            # Write-through: the saved list becomes the registry, no re-read needed
+            self._bots = bots
+            self._bots_stamp = self._stat_stamp(self.bots_file)
+            self._index_bots()
+    
+    def _pid_file(self, bot_id):
+        return os.path.join(self.pid_dir, f'bot_{bot_id}.pid')
+    
+    def _read_pid(self, bot_id):
+        """PID of the bot's screen session, or None if there is no PID file"""
+        try:
+            with open(self._pid_file(bot_id), 'r') as f:
+                return int(f.read().strip())
+        except (OSError, ValueError):
+            return None
+    
+    def _write_pid(self, bot_id, pid):
+        """Record the bot's screen session PID"""
+        os.makedirs(self.pid_dir, exist_ok=True)
+        with open(self._pid_file(bot_id), 'w') as f:
+            f.write(str(pid))
+    
+    def _remove_pid(self, bot_id):
+        try:
+            os.remove(self._pid_file(bot_id))
+        except OSError:
+            pass
+    
+    @staticmethod
+    def _pid_alive(pid):
+        """True if a process with this PID exists (signal 0 = existence check only)"""
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        return True
+    
+    @staticmethod
+    def _pid_is_screen(pid):
+        """
+        False if the PID now belongs to some other program (PIDs get reused)
+        
+        Checked via /proc; where there is none, a live PID is taken as is.
+        """
+        try:
+            with open(f'/proc/{pid}/comm') as f:
+                return 'screen' in f.read().lower()
+        except FileNotFoundError:
+            return not os.path.isdir('/proc/self')
+        except OSError:
+            return True
+    
     def get_account_info(self):
-        """Get account info"""
+        """
+        Get account info (latest background snapshot)
+        
+        Only the very first call may wait, briefly, for the first fetch.
+        Returns None if Binance hasn't answered yet.
+        """
+        self._account_ready.wait(timeout=10)
+        return self._account_snapshot
+    
+    def fetch_account_info(self):
+        """
+        Get account info from Binance (blocking REST call)
+        
+        Returns {'stale': True} if Binance timed out or was unreachable, and
+        None on any other error.
+        """
         try:
             account = self.client.client.get_account()
-            usdt_balance = next((b for b in account['balances'] if b['asset'] == 'USDT'), None)
-            
-            usdt_free = float(usdt_balance['free']) if usdt_balance else 0
-            usdt_locked = float(usdt_balance['locked']) if usdt_balance else 0
             
-            # Get all non-zero balances
+            # Single pass: pick out USDT and every other non-zero balance.
+            # Binance returns hundreds of all-zero assets ("0.00000000"), so
+            # skip those on the raw string before paying for float().
+            # Builtins/methods are bound to locals for the hot loop.
+            _float = float
+            usdt_free = usdt_locked = 0.0
             balances = []
+            append = balances.append
             for b in account['balances']:
-                free = float(b['free'])
-                locked = float(b['locked'])
-                if free + locked > 0 and b['asset'] != 'USDT':
-                    balances.append({
-                        'asset': b['asset'],
+                asset, free_s, locked_s = b['asset'], b['free'], b['locked']
+                if asset == 'USDT':
+                    usdt_free, usdt_locked = _float(free_s), _float(locked_s)
+                    continue
+                if not free_s.strip('0.') and not locked_s.strip('0.'):
+                    continue
+                free = _float(free_s)
+                locked = _float(locked_s)
+                total = free + locked
+                if total > 0:
+                    append({
+                        'asset': asset,
                         'free': free,
                         'locked': locked,
-                        'total': free + locked
+                        'total': total
                     })
             
+            # Value the other assets in USD with ONE ticker call for all
+            # symbols (not one get_symbol_ticker per balance)
+            balances_usd = 0
+            if balances:
+                try:
+                    prices = {t['symbol']: float(t['price']) for t in self.client.client.get_all_tickers()}
+                except Exception:
+                    prices = {}
+                for b in balances:
+                    b['usd_value'] = b['total'] * prices.get(b['asset'] + 'USDT', 0)
+                    balances_usd += b['usd_value']
+            
             return {
                 'usdt_free': usdt_free,
                 'usdt_locked': usdt_locked,
                 'usdt_total': usdt_free + usdt_locked,
-                'balances': balances
+                'balances': balances,
+                'balances_usd': balances_usd
             }
-        except:
+        except (requests.Timeout, requests.ConnectionError):
+            return {'stale': True}
+        except Exception:
             return None
     
     def start_bot(self, bot_id):
         """Start a bot - CLEAN startup logic"""
         try:
             bots = self.get_bots()
-            bot = next((b for b in bots if b['id'] == bot_id), None)
+            bot = self._find_bot(bots, bot_id)
             if not bot:
                 return False, 'Bot not found'
             
             # CRITICAL: If bot has never traded (0 trades), delete old position file
             # This prevents old positions from being loaded into new bots
             if bot.get('trades', 0) == 0:
-                position_file = f'bot_{bot_id}_position.json'
+                position_file = bot_position_path(bot_id)
                 if os.path.exists(position_file):
                     print(f"[CLEANUP] Deleting old position file for new bot {bot_id}")
                     os.remove(position_file)
                 
-                # Also clear old log file for fresh start
-                log_file = f'bot_{bot_id}.log'
+                # Also clear old log / stats files for fresh start
+                log_file = bot_log_path(bot_id)
                 if os.path.exists(log_file):
                     print(f"[CLEANUP] Clearing old log for new bot {bot_id}")
                     os.remove(log_file)
+                if os.path.exists(bot_stats_path(bot_id)):
+                    os.remove(bot_stats_path(bot_id))
             
-            # Build command to start bot
-            bot_name = bot['name'].replace("'", "'\\''")  # Escape single quotes
-            cmd = f"cd {os.getcwd()} && screen -dmS bot_{bot_id} python3 integrated_trader.py {bot_id} '{bot_name}' {bot['symbol']} {bot['strategy']} {bot['trade_amount']}"
+            # Build command to start bot (argv list - no shell, no quoting)
+            cmd = [
+                'screen', '-dmS', f'bot_{bot_id}',
+                'python3', 'integrated_trader.py',
+                str(bot_id), bot['name'], bot['symbol'], bot['strategy'], str(bot['trade_amount'])
+            ]
             
             print(f"[DEBUG] Starting bot {bot_id}: {bot['symbol']} with ${bot['trade_amount']}")
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True, cwd=os.getcwd())
-            
-            if result.returncode != 0:
-                print(f"[ERROR] Command failed: {result.stderr}")
-                return False, f'Command failed: {result.stderr}'
-            
-            # Give it time to start
-            time.sleep(2.0)
+            # Don't block on screen; it detaches straight away and its exit
+            # code is collected after the startup wait below
+            proc = subprocess.Popen(cmd, cwd=BASE_DIR, close_fds=True, start_new_session=True,
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             
-            # Verify screen session exists
-            check = subprocess.run(['screen', '-list'], capture_output=True, text=True)
+            # Wait for the session to come up (returns as soon as it does,
+            # or as soon as screen fails)
+            returncode, pid = self._wait_for_startup(bot_id, proc)
+            if returncode:
+                print(f"[ERROR] Command failed: screen exited with code {returncode}")
+                return False, f'Command failed: screen exited with code {returncode}'
             
-            if f'bot_{bot_id}' not in check.stdout:
+            if pid is None:
                 # Bot failed to start - check why
-                log_file = os.path.join(os.getcwd(), f'bot_{bot_id}.log')
+                log_file = bot_log_path(bot_id)
                 error_msg = 'Bot failed to start (screen session not found)'
                 
                 if os.path.exists(log_file):
@@ -172,10 +655,10 @@ class BotManager:
                 
                 return False, error_msg
             
-            # Success!
+            # Success! Remember the session PID so status checks skip screen
+            self._write_pid(bot_id, pid)
             bot['status'] = 'running'
-            with open(self.bots_file, 'w') as f:
-                json.dump(bots, f, indent=2)
+            self._save_bots(bots)
             
             print(f"[SUCCESS] Bot {bot_id} started successfully")
             return True, 'Bot started successfully'
@@ -186,17 +669,58 @@ class BotManager:
             traceback.print_exc()
             return False, str(e)
     
+    def _wait_for_startup(self, bot_id, proc):
+        """
+        Wait for a just-launched bot session to show up
+        
+        Returns (screen's exit code or None, session pid or None); the pid is
+        None if screen failed or the session didn't appear within
+        startup_timeout. Returns as soon as either is known. Wakes on new
+        screen sockets when inotify_simple is available, else re-checks every
+        50ms.
+        """
+        name = f'bot_{bot_id}'
+        deadline = time.monotonic() + self.startup_timeout
+        try:
+            returncode = proc.wait(timeout=self.startup_timeout)
+        except subprocess.TimeoutExpired:
+            returncode = None
+        if returncode:
+            return returncode, None
+        
+        watch = None
+        if inotify_simple is not None and self._screen_dir:
+            try:
+                watch = inotify_simple.INotify()
+                watch.add_watch(self._screen_dir, inotify_simple.flags.CREATE)
+            except OSError:
+                watch = None
+        try:
+            while True:
+                pid = self._screen_sessions(fresh=True).get(name)
+                remaining = deadline - time.monotonic()
+                if pid is not None or remaining <= 0:
+                    return returncode, pid
+                if watch is not None:
+                    watch.read(timeout=int(remaining * 1000) + 1)
+                else:
+                    time.sleep(min(0.05 if self._screen_dir else 0.25, remaining))
+        finally:
+            if watch is not None:
+                watch.close()
+    
     def stop_bot(self, bot_id):
         """Stop a bot"""
         try:
             subprocess.run(['screen', '-S', f'bot_{bot_id}', '-X', 'quit'])
+            self._remove_pid(bot_id)
+            self._screen_cache = (0.0, {})
             
             bots = self.get_bots()
-            bot = next((b for b in bots if b['id'] == bot_id), None)
+            bot = self._find_bot(bots, bot_id)
             if bot:
                 bot['status'] = 'stopped'
-                with open(self.bots_file, 'w') as f:
-                    json.dump(bots, f, indent=2)
+                self._save_bots(bots)
             
             return True, 'Bot stopped'
         except Exception as e:
@@ -206,111 +730,372 @@ class BotManager:
         """Update bot settings"""
         try:
             bots = self.get_bots()
-            bot = next((b for b in bots if b['id'] == bot_id), None)
+            bot = self._find_bot(bots, bot_id)
             if not bot:
                 return False, 'Bot not found'
             
             # Update fields
             bot.update(updates)
             
-            with open(self.bots_file, 'w') as f:
-                json.dump(bots, f, indent=2)
+            self._save_bots(bots)
             
             return True, 'Bot updated'
         except Exception as e:
             return False, str(e)
     
-    def get_bot_details(self, bot_id):
+    def get_bot_details(self, bot_id, log_lines=DETAILS_LOG_LINES):
         """Get detailed bot info including logs and profit history"""
         try:
             bots = self.get_bots()
-            bot = next((b for b in bots if b['id'] == bot_id), None)
+            bot = self._find_bot(bots, bot_id)
             if not bot:
                 return None
             
-            # Get recent log entries (single log file per bot)
-            log_file = os.path.join(os.getcwd(), f'bot_{bot_id}.log')
-            recent_logs = []
-            profit_history = []
-            last_check_time = None
-            
+            log_file = bot_log_path(bot_id)
             print(f"[DEBUG] Looking for log file: {log_file}")
             print(f"[DEBUG] File exists: {os.path.exists(log_file)}")
             
-            if os.path.exists(log_file):
-                with open(log_file, 'r') as f:
-                    lines = f.readlines()
-                    recent_logs = [line.strip() for line in lines[-20:]]
-                    
-                    # Extract profit history from trades
-                    for line in lines:
-                        if 'SELL' in line and 'Profit:' in line:
-                            try:
-                                # Extract timestamp and profit
-                                parts = line.split()
-                                timestamp = f"{parts[0]} {parts[1]}"
-                                
-                                # Find profit value
-                                for i, part in enumerate(parts):
-                                    if 'Profit:' in part and i + 1 < len(parts):
-                                        profit_str = parts[i + 1].replace('$', '').replace('+', '')
-                                        profit = float(profit_str)
-                                        profit_history.append({
-                                            'time': timestamp,
-                                            'profit': profit
-                                        })
-                                        break
-                            except:
-                                continue
-                    
-                    # Find last check time (look for "Generating signal" or "Signal:" in logs)
-                    for line in reversed(lines):
-                        if 'Signal:' in line or 'Generating signal' in line:
-                            try:
-                                parts = line.split()
-                                if len(parts) >= 2:
-                                    last_check_time = f"{parts[0]} {parts[1]}"
-                                    break
-                            except:
-                                continue
-            
-            # Get position info from logs
-            position_info = None
-            for line in reversed(recent_logs):
-                if 'Position: LONG' in line:
-                    position_info = line
+            return self._bot_details(bot, log_lines)
+        except Exception as e:
+            print(f"[ERROR] get_bot_details exception: {e}")
+            import traceback
+            traceback.print_exc()
+            return None
+    
+    def get_all_bot_details(self):
+        """Details (as get_bot_details) for every bot: {bot_id: details}"""
+        bots = self.get_bots()
+        return dict(zip((bot['id'] for bot in bots), self._io_pool.map(self._bot_details, bots)))
+    
+    def _bot_details(self, bot, log_lines=DETAILS_LOG_LINES):
+        """Logs, profit history and position for one entry from get_bots()"""
+        # Get recent log entries (single log file per bot)
+        log_file = bot_log_path(bot['id'])
+        recent_logs = []
+        
+        # Profit history / last check / position (the newest "Position: LONG"
+        # line, if it is among the recent lines) come from the trader's stats
+        # sidecar, or from the incremental log scan for bots without one
+        scan = {'profit_history': [], 'profit_series': [], 'trade_count': 0,
+                'last_check': None, 'position': None}
+        
+        stats = self._read_stats(bot['id'])
+        if os.path.exists(log_file):
+            recent_logs = self._tail_lines(log_file, log_lines)
+            if stats is None:
+                scan = self._scan_log(bot['id'], log_file, recent=DETAILS_LOG_LINES)
+        if stats is not None:
+            scan = dict(stats, position=next(
+                (line for line in reversed(recent_logs[-DETAILS_LOG_LINES:]) if 'Position: LONG' in line), None))
+        
+        # If no logs, add helpful message
+        if not recent_logs:
+            if bot['status'] == 'running':
+                recent_logs = [
+                    f"No logs found at: {log_file}",
+                    "Bot may be starting up...",
+                    "Check back in 30 seconds or run: tail -f " + log_file
+                ]
+            else:
+                recent_logs = [
+                    "Bot is stopped - no recent activity",
+                    f"Start the bot to see logs at: {log_file}"
+                ]
+        
+        return {
+            'bot': bot,
+            'recent_logs': recent_logs,
+            'position_info': scan['position'],
+            'profit_history': scan['profit_history'],
+            'profit_series': scan['profit_series'],
+            'profit_series_count': scan['trade_count'],  # points before downsampling
+            'last_check_time': scan['last_check'],
+            'log_file_path': log_file
+        }
+    
+    @staticmethod
+    def _tail_lines(log_file, count):
+        """
+        Last `count` lines of a file
+        
+        Reads only its final LOG_TAIL_BYTES, doubling the window while that
+        holds too few lines (long lines, or a big count).
+        """
+        fd = os.open(log_file, os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+            window = LOG_TAIL_BYTES
+            while True:
+                start = max(0, size - window)
+                data = os.pread(fd, size - start, start)
+                if start == 0 or data.count(b'\n') > count:
                     break
+                window *= 2
+        finally:
+            os.close(fd)
+        
+        lines = data.split(b'\n')
+        if start > 0:
+            lines = lines[1:]  # first line is probably cut
+        lines = [line.decode('utf-8', 'replace').strip() for line in lines[-count - 1:]]
+        if lines and not lines[-1]:
+            lines.pop()  # trailing newline
+        return lines[-count:]
+    
+    def get_all_bot_tails(self, bot_ids, count=20):
+        """Last `count` log lines for each bot, read concurrently: {bot_id: [lines]}"""
+        def tail(bot_id):
+            try:
+                return self._tail_lines(bot_log_path(bot_id), count)
+            except OSError:
+                return []
+        
+        bot_ids = list(bot_ids)
+        return dict(zip(bot_ids, self._io_pool.map(tail, bot_ids)))
+    
+    def _scan_log(self, bot_id, log_file, recent=20):
+        """
+        Profit history, last check time and position line from a bot log,
+        parsed incrementally
+        
+        Returns a dict with profit_history (the last PROFIT_HISTORY_LEN
+        trades), profit_series (cumulative profit over every trade in the log
+        as ready-to-plot {x: epoch ms, y} points, downsampled to
+        MAX_SERIES_POINTS and rebuilt only when a trade was added),
+        trade_count, last_check (newest signal line), last_activity (newest
+        timestamped line) and position. The position line is only returned
+        if it is among the last `recent` lines.
+        
+        Only bytes appended since the previous call are read; the results
+        accumulate in self._log_state. A shrunk or replaced file (start_bot
+        clears logs of fresh bots) is re-scanned from the start.
+        """
+        with self._log_locks.setdefault(bot_id, threading.Lock()):
+            fd = os.open(log_file, os.O_RDONLY)
+            try:
+                st = os.fstat(fd)
+                state = self._log_state.get(bot_id)
+                if state is None or state['inode'] != st.st_ino or st.st_size < state['offset']:
+                    state = {
+                        'inode': st.st_ino,
+                        'offset': 0,
+                        'profits': deque(maxlen=PROFIT_HISTORY_LEN),
+                        'total': 0.0,
+                        'points': [],  # (epoch ms, cumulative profit) per trade
+                        'series': None,
+                        'last_check': None,
+                        'last_activity': None,
+                        'lines': 0,
+                        'position': None,
+                        'position_line': 0
+                    }
+                    self._log_state[bot_id] = state
+                
+                if st.st_size - state['offset'] >= LOG_MMAP_MIN:
+                    with mmap.mmap(fd, st.st_size, access=mmap.ACCESS_READ) as mm:
+                        end = mm.rfind(b'\n', state['offset']) + 1
+                        if end > 0:
+                            self._scan_buffer(mm, state['offset'], end, state)
+                            state['offset'] = end
+                
+                while state['offset'] < st.st_size:
+                    data = os.pread(fd, min(LOG_READ_CHUNK, st.st_size - state['offset']), state['offset'])
+                    end = data.rfind(b'\n') + 1
+                    if end == 0:
+                        if len(data) < LOG_READ_CHUNK:
+                            break  # unfinished last line - pick it up next time
+                        end = len(data)  # absurdly long line, skip through it
+                    self._scan_buffer(data, 0, end, state)
+                    state['offset'] += end
+            finally:
+                os.close(fd)
             
-            # Keep last 50 profit data points
-            profit_history = profit_history[-50:]
-            
-            # If no logs, add helpful message
-            if not recent_logs:
-                if bot['status'] == 'running':
-                    recent_logs = [
-                        f"No logs found at: {log_file}",
-                        "Bot may be starting up...",
-                        "Check back in 30 seconds or run: tail -f " + log_file
-                    ]
-                else:
-                    recent_logs = [
-                        "Bot is stopped - no recent activity",
-                        f"Start the bot to see logs at: {log_file}"
-                    ]
+            if state['series'] is None:
+                state['series'] = [{'x': x, 'y': y}
+                                   for x, y in downsample_lttb(state['points'], MAX_SERIES_POINTS)]
             
             return {
-                'bot': bot,
-                'recent_logs': recent_logs,
-                'position_info': position_info,
-                'profit_history': profit_history,
-                'last_check_time': last_check_time,
-                'log_file_path': log_file
+                'profit_history': list(state['profits']),
+                'profit_series': state['series'],
+                'trade_count': len(state['points']),
+                'last_check': state['last_check'],
+                'last_activity': state['last_activity'],
+                'position': state['position'] if state['lines'] - state['position_line'] <= recent else None
             }
-        except Exception as e:
-            print(f"[ERROR] get_bot_details exception: {e}")
-            import traceback
-            traceback.print_exc()
+    
+    def _read_stats(self, bot_id):
+        """
+        A bot's stats sidecar in _scan_log's shape, or None if it has none
+        
+        The file is only re-parsed when its stat stamp changes. The profit
+        series comes from its profit_series ([epoch ms, cumulative profit]
+        per trade - the trader keeps the last 5000), downsampled like the
+        log scan's. Sidecars from before that field existed only cover their
+        profit_history window (last PROFIT_HISTORY_LEN trades), cumulated up
+        to cum_profit; trade_count is the number of points either way.
+        """
+        path = bot_stats_path(bot_id)
+        try:
+            stamp = self._stat_stamp(path)
+            cached = self._stats_cache.get(bot_id)
+            if cached and cached[0] == stamp:
+                return cached[1]
+            with open(path, 'rb') as f:
+                raw = json.load(f)
+        except (OSError, ValueError):
             return None
+        
+        # Anything not in the shape integrated_trader.py writes (hand-edited,
+        # or from an older trader) is ignored - the log scan takes over
+        def number(value):
+            return isinstance(value, (int, float)) and not isinstance(value, bool)
+        
+        if not isinstance(raw, dict):
+            return None
+        history = raw.get('profit_history') or []
+        series = raw.get('profit_series')
+        if (not isinstance(history, list)
+                or not (series is None or isinstance(series, list) and all(
+                    isinstance(point, list) and len(point) == 2
+                    and number(point[0]) and number(point[1]) for point in series))
+                or not number(raw.get('cum_profit', 0.0))
+                or not number(raw.get('trades', 0))
+                or not isinstance(raw.get('last_check'), (str, type(None)))
+                or not all(isinstance(trade, dict) and isinstance(trade.get('time'), str)
+                           and number(trade.get('profit')) for trade in history)):
+            return None
+        
+        if series is not None:
+            points = [tuple(point) for point in series]
+        else:
+            total = raw.get('cum_profit', 0.0) - sum(trade['profit'] for trade in history)
+            points = []
+            for trade in history:
+                total += trade['profit']
+                ms = self._log_time_ms(trade['time'])
+                if ms is not None:
+                    points.append((ms, round(total, 8)))
+        
+        stats = {
+            'profit_history': history,
+            'profit_series': [{'x': x, 'y': y} for x, y in downsample_lttb(points, MAX_SERIES_POINTS)],
+            'trade_count': len(points),
+            'last_check': raw.get('last_check')
+        }
+        self._stats_cache[bot_id] = (stamp, stats)
+        return stats
+    
+    def get_last_activity(self, bot_id):
+        """
+        When a bot last checked the market, or None
+        
+        From its stats sidecar when it has one; otherwise the newest
+        timestamped log line, from the same incremental scan as the details
+        dialog, so the overview and the dialog share one read of any new
+        log bytes.
+        """
+        stats = self._read_stats(bot_id)
+        if stats is not None and stats['last_check']:
+            return stats['last_check']
+        log_file = bot_log_path(bot_id)
+        try:
+            return self._scan_log(bot_id, log_file)['last_activity']
+        except FileNotFoundError:
+            return None
+    
+    def get_all_last_activity(self, bot_ids):
+        """get_last_activity for several bots, read concurrently: {bot_id: timestamp}"""
+        def last_activity(bot_id):
+            try:
+                return self.get_last_activity(bot_id)
+            except Exception as e:
+                print(f"[DEBUG] Error reading log for bot {bot_id}: {e}")
+                return None
+        
+        bot_ids = list(bot_ids)
+        return dict(zip(bot_ids, self._io_pool.map(last_activity, bot_ids)))
+    
+    @classmethod
+    def _scan_buffer(cls, buf, start, end, state):
+        """
+        Fold the log lines in buf[start:end] into a _scan_log state
+        
+        buf is bytes or an mmap of the whole log (first look at a big one).
+        Nothing loops over the lines in Python: trades are found by a
+        literal-led regex, and only the last signal / position / timestamped
+        line matters, so those are found with rfind. Just the matching lines
+        are sliced out and decoded.
+        """
+        def line_at(pos):
+            """(start offset, decoded text) of the line containing pos"""
+            line_start = buf.rfind(b'\n', start, pos) + 1 or start
+            line_end = buf.find(b'\n', pos, end)
+            if line_end < 0:
+                line_end = end
+            return line_start, buf[line_start:line_end].decode('utf-8', 'replace')
+        
+        def count_lines(a, b):
+            return sum(buf[i:min(i + LOG_READ_CHUNK, b)].count(b'\n')
+                       for i in range(a, b, LOG_READ_CHUNK))
+        
+        last_line = -1
+        for hint in TRADE_HINT_RE.finditer(buf, start, end):
+            line_start, line = line_at(hint.start())
+            if line_start == last_line:
+                continue  # one trade per line
+            last_line = line_start
+            match = TRADE_RE.match(line)
+            if match:
+                profit = float(match['profit'])
+                state['profits'].append({'time': match['ts'], 'profit': profit})
+                state['total'] += profit
+                ms = cls._log_time_ms(match['ts'])
+                if ms is not None:
+                    state['points'].append((ms, round(state['total'], 8)))
+                state['series'] = None
+        
+        # Newest signal line (walking back past any that don't parse)
+        limit = end
+        while limit > start:
+            pos = max(buf.rfind(b'Signal:', start, limit), buf.rfind(b'Generating signal', start, limit))
+            if pos < 0:
+                break
+            line_start, line = line_at(pos)
+            match = SIGNAL_RE.match(line)
+            if match:
+                state['last_check'] = match['ts']
+                break
+            limit = line_start
+        
+        # Newest line with content that starts with a timestamp
+        limit = end - 1
+        while limit > start:
+            line_start, line = line_at(limit - 1)
+            match = LOG_TIME_RE.match(line) if len(line) > 20 else None
+            if match:
+                state['last_activity'] = ' '.join(match['ts'].split())
+                break
+            limit = line_start
+        
+        pos = buf.rfind(b'Position: LONG', start, end)
+        if pos >= 0:
+            line_start, line = line_at(pos)
+            state['position'] = line.strip()
+            state['position_line'] = state['lines'] + count_lines(start, line_start)
+        
+        state['lines'] += count_lines(start, end)
+    
+    @staticmethod
+    def _log_time_ms(text):
+        """Epoch ms for a log timestamp ("2024-01-02 03:04:05[,678]"), or None"""
+        try:
+            ts = datetime.strptime(text.replace(',', '.'), '%Y-%m-%d %H:%M:%S.%f')
+        except ValueError:
+            try:
+                ts = datetime.strptime(text, '%Y-%m-%d %H:%M:%S')
+            except ValueError:
+                return None
+        return int(ts.timestamp() * 1000)
     
     def create_bot(self, name, symbol, strategy, trade_amount):
         """Create a new bot"""
@@ -339,8 +1124,7 @@ class BotManager:
             bots.append(new_bot)
             
             # Save to file
-            with open(self.bots_file, 'w') as f:
-                json.dump(bots, f, indent=2)
+            self._save_bots(bots)
             
             return True, f'Bot {name} created successfully'
             
@@ -351,7 +1135,7 @@ class BotManager:
         """Delete a bot"""
         try:
             bots = self.get_bots()
-            bot = next((b for b in bots if b['id'] == bot_id), None)
+            bot = self._find_bot(bots, bot_id)
             
             if not bot:
                 return False, 'Bot not found'
@@ -364,16 +1148,18 @@ class BotManager:
             bots = [b for b in bots if b['id'] != bot_id]
             
             # Save updated list
-            with open(self.bots_file, 'w') as f:
-                json.dump(bots, f, indent=2)
+            self._save_bots(bots)
             
             # Clean up files
             import os
             try:
-                if os.path.exists(f'bot_{bot_id}.log'):
-                    os.remove(f'bot_{bot_id}.log')
-                if os.path.exists(f'bot_{bot_id}_position.json'):
-                    os.remove(f'bot_{bot_id}_position.json')
+                if os.path.exists(bot_log_path(bot_id)):
+                    os.remove(bot_log_path(bot_id))
+                if os.path.exists(bot_position_path(bot_id)):
+                    os.remove(bot_position_path(bot_id))
+                if os.path.exists(bot_stats_path(bot_id)):
+                    os.remove(bot_stats_path(bot_id))
+                self._remove_pid(bot_id)
             except:
                 pass
             
@@ -385,105 +1171,283 @@ class BotManager:
 bot_manager = BotManager()
 
 # API Routes
+@app.route('/vendor/<path:filename>')
+def vendor(filename):
+    response = send_from_directory(VENDOR_DIR, filename, max_age=31536000)
+    response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+    return response
+
 @app.route('/')
 def index():
-    return HTML
+    # HTML_BYTES / HTML_GZ / HTML_BR are built once at import (see bottom of file)
+    encoding = response_encoding() if Compress is None else None
+    if encoding is not None:
+        body, suffix = (HTML_BR, '-br') if encoding == 'br' else (HTML_GZ, '-gz')
+        response = Response(body, mimetype='text/html',
+                            headers={'Cache-Control': 'public, max-age=300',
+                                     'Content-Encoding': encoding})
+        response.set_etag(HTML_ETAG + suffix)
+    else:
+        response = Response(HTML_BYTES, mimetype='text/html',
+                            headers={'Cache-Control': 'public, max-age=300'})
+        response.set_etag(HTML_ETAG)
+    response.vary.add('Accept-Encoding')
+    # 304 Not Modified when the browser's If-None-Match still matches
+    return response.make_conditional(request)
+
+# Short-lived snapshot of /api/overview so bursty refreshes (several tabs,
+# post-action reloads) don't each hit Binance and fork screen
+OVERVIEW_TTL = 5  # seconds
+ALERT_SNAPSHOT_MAX_AGE = 10  # seconds; send_alert may use an older overview
+_overview_cache = {'ts': 0, 'data': None, 'body': None, 'etag': None}
+# Change tracking for /api/overview?since=<seq>: seq goes up whenever a bot
+# is added, changed or removed. It starts from the clock, so a seq a page
+# got from an earlier run of the dashboard is always too old or too new.
+_overview_seqs = {
+    'start': int(time.time() * 1000),
+    'seq': int(time.time() * 1000),
+    'bots': {},     # bot id -> (seq it last changed at, serialized bot)
+    'removed': {},  # bot id -> seq it was removed at
+}
+_overview_lock = threading.Lock()
+_overview_changed = threading.Condition()  # notified by invalidate_overview
+
+def invalidate_overview():
+    """Drop the cached overview (call after any bot state change)"""
+    with _overview_lock:
+        _overview_cache['ts'] = 0
+        _overview_cache['data'] = None
+    # Wake the WebSocket / SSE pushers so clients see the change right away
+    with _overview_changed:
+        _overview_changed.notify_all()
+
+def build_overview():
+    """Collect bots and totals for the dashboard (balances: /api/account)"""
+    bots = bot_manager.get_bots()
+    
+    # Add last check time for each bot (the running bots' logs / stats
+    # files are read in parallel)
+    checks = bot_manager.get_all_last_activity(b['id'] for b in bots if b['status'] == 'running')
+    for bot in bots:
+        if bot['status'] == 'running':
+            last_check = checks[bot['id']]
+            # If no timestamp found in logs, use current time as fallback
+            if not last_check and bot['status'] == 'running':
+                from datetime import datetime
+                last_check = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                print(f"[DEBUG] No log timestamp found for bot {bot['id']}, using current time: {last_check}")
+            
+            bot['last_check'] = last_check
+        else:
+            bot['last_check'] = None
+    
+    total_profit = sum(b.get('profit', 0) for b in bots)
+    total_trades = sum(b.get('trades', 0) for b in bots)
+    running_bots = len([b for b in bots if b['status'] == 'running'])
+    
+    return {
+        'success': True,
+        'bots': bots,
+        'stats': {
+            'total_profit': total_profit,
+            'total_trades': total_trades,
+            'running_bots': running_bots,
+            'total_bots': len(bots)
+        }
+    }
+
+def cached_overview(max_age=OVERVIEW_TTL):
+    """
+    (data, body, etag) for the overview
+    
+    The cached one if it is at most max_age seconds old, else a fresh one;
+    the JSON body and its ETag are computed once per build.
+    """
+    with _overview_lock:
+        if not (_overview_cache['data'] and time.time() - _overview_cache['ts'] < max_age):
+            data = build_overview()
+            data['seq'] = _track_bot_changes(data['bots'])
+            body = dumps(data)
+            _overview_cache['data'] = data
+            _overview_cache['body'] = body
+            _overview_cache['etag'] = hashlib.sha1(body).hexdigest()
+            _overview_cache['ts'] = time.time()
+        return _overview_cache['data'], _overview_cache['body'], _overview_cache['etag']
+
+def _track_bot_changes(bots):
+    """Record which bots changed since the last build; returns the current seq"""
+    known = _overview_seqs['bots']
+    removed = _overview_seqs['removed']
+    seq = _overview_seqs['seq'] + 1
+    changed = False
+    
+    current = set()
+    for bot in bots:
+        current.add(bot['id'])
+        serialized = dumps(bot)
+        previous = known.get(bot['id'])
+        if previous is None or previous[1] != serialized:
+            known[bot['id']] = (seq, serialized)
+            removed.pop(bot['id'], None)
+            changed = True
+    for bot_id in [i for i in known if i not in current]:
+        del known[bot_id]
+        removed[bot_id] = seq
+        changed = True
+    
+    if changed:
+        _overview_seqs['seq'] = seq
+    return _overview_seqs['seq']
+
+def overview_delta(since):
+    """
+    The overview as changes since seq `since`
+    
+    Only the bots added or changed after it, plus the ids removed after it;
+    None if `since` isn't a seq from this run (the caller sends everything).
+    """
+    data = get_overview()
+    with _overview_lock:
+        if not _overview_seqs['start'] <= since <= data['seq']:
+            return None
+        known = _overview_seqs['bots']
+        return {
+            'success': True,
+            'seq': data['seq'],
+            'stats': data['stats'],
+            'changed': [b for b in data['bots'] if known.get(b['id'], (since + 1,))[0] > since],
+            'removed_ids': [i for i, seq in _overview_seqs['removed'].items() if seq > since],
+        }
+
+def get_overview(max_age=OVERVIEW_TTL):
+    """The cached overview if it is at most max_age seconds old, else a fresh one"""
+    return cached_overview(max_age)[0]
 
 @app.route('/api/overview')
 def overview():
     try:
-        bots = bot_manager.get_bots()
-        account = bot_manager.get_account_info()
-        
-        # Add last check time for each bot
-        for bot in bots:
-            if bot['status'] == 'running':
-                # Check single log file per bot
-                log_file = os.path.join(os.getcwd(), f"bot_{bot['id']}.log")
-                
-                last_check = None
-                if os.path.exists(log_file):
-                    try:
-                        with open(log_file, 'r') as f:
-                            lines = f.readlines()
-                            # Look for ANY recent activity (broader search)
-                            for line in reversed(lines[-100:]):  # Check last 100 lines
-                                # Look for timestamp pattern first
-                                if len(line.strip()) > 20:  # Ensure line has content
-                                    parts = line.split()
-                                    if len(parts) >= 2:
-                                        # Check if first two parts look like a timestamp
-                                        if (len(parts[0]) == 10 and parts[0].count('-') == 2 and 
-                                            len(parts[1]) >= 8 and ':' in parts[1]):
-                                            # Found a valid timestamp - use it as last check
-                                            timestamp = f"{parts[0]} {parts[1]}"
-                                            last_check = timestamp
-                                            break
-                    except Exception as e:
-                        print(f"[DEBUG] Error reading log file {log_file}: {e}")
-                        pass
-                # If no timestamp found in logs, use current time as fallback
-                if not last_check and bot['status'] == 'running':
-                    from datetime import datetime
-                    last_check = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                    print(f"[DEBUG] No log timestamp found for bot {bot['id']}, using current time: {last_check}")
-                
-                bot['last_check'] = last_check
+        # ETag'd: a poll that finds nothing changed gets an empty 304, and
+        # ?since=<seq> gets only the bots changed after that seq
+        _, body, etag = cached_overview()
+        since = request.args.get('since', type=int)
+        if since is not None and not request.if_none_match.contains_weak(etag):
+            delta = overview_delta(since)
+            if delta is not None:
+                body = dumps(delta)
+        response = Response(body, mimetype='application/json',
+                            headers={'Cache-Control': 'no-cache'})
+        response.set_etag(etag)
+        return response.make_conditional(request)
+    except Exception as e:
+        return ojsonify({'success': False, 'error': str(e)})
+
+if sock is not None:
+    @sock.route('/ws/dashboard')
+    def dashboard_ws(ws):
+        """
+        Push the overview to the page whenever it changes
+        
+        Wakes on invalidate_overview() (start/stop/edit from the dashboard)
+        and every OVERVIEW_TTL seconds to pick up changes made by the bots
+        themselves; nothing is sent while the overview stays the same.
+        """
+        last = None
+        while ws.connected:
+            payload = dumps({'type': 'overview', 'data': get_overview()})
+            if payload != last:
+                ws.send(payload.decode('utf-8'))
+                last = payload
+            with _overview_changed:
+                _overview_changed.wait(timeout=OVERVIEW_TTL)
+
+@app.route('/api/events')
+def dashboard_events():
+    """
+    Server-Sent Events version of /ws/dashboard
+    
+    Plain HTTP, so it needs no extra package and gets through proxies that
+    block WebSocket upgrades; the page falls back to it when the socket
+    can't connect. Same wake-ups as the socket; a comment line keeps the
+    connection (and disconnect detection) alive while nothing changes.
+    """
+    def stream():
+        yield 'retry: 5000\n\n'
+        last = None
+        while True:
+            _, body, etag = cached_overview()
+            if etag != last:
+                yield b'event: overview\ndata: ' + body + b'\n\n'
+                last = etag
             else:
-                bot['last_check'] = None
-        
-        total_profit = sum(b.get('profit', 0) for b in bots)
-        total_trades = sum(b.get('trades', 0) for b in bots)
-        running_bots = len([b for b in bots if b['status'] == 'running'])
-        
-        return jsonify({
-            'success': True,
-            'bots': bots,
-            'account': account,
-            'stats': {
-                'total_profit': total_profit,
-                'total_trades': total_trades,
-                'running_bots': running_bots,
-                'total_bots': len(bots)
-            }
-        })
+                yield ': keepalive\n\n'
+            with _overview_changed:
+                _overview_changed.wait(timeout=OVERVIEW_TTL)
+    
+    return Response(stream_with_context(stream()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+@app.route('/api/account')
+def account():
+    """Account balances - they change rarely, so the page polls this less often"""
+    try:
+        return ojsonify({'success': True, 'account': bot_manager.get_account_info()})
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)})
+        return ojsonify({'success': False, 'error': str(e)})
+
+# The trending list comes from Binance's full 24h ticker snapshot (every
+# pair); it barely moves within a few seconds, so it is reused for a while
+TRENDING_TTL = 15  # seconds
+_trending_cache = {'ts': 0, 'coins': None}
+_trending_lock = threading.Lock()
 
 @app.route('/api/search-coins')
 def api_search_coins():
     """Search for trending coins on Binance"""
     try:
-        # Get 24h ticker data (sorted by volume)
-        tickers = bot_manager.client.client.get_ticker()
+        with _trending_lock:
+            if _trending_cache['coins'] is None or time.time() - _trending_cache['ts'] >= TRENDING_TTL:
+                _trending_cache['coins'] = fetch_trending_coins()
+                _trending_cache['ts'] = time.time()
+            trending_coins = _trending_cache['coins']
         
-        # Filter USDT pairs and sort by volume
-        usdt_pairs = []
-        for ticker in tickers:
-            if ticker['symbol'].endswith('USDT'):
-                try:
-                    volume = float(ticker['quoteVolume'])
-                    price_change = float(ticker['priceChangePercent'])
-                    usdt_pairs.append({
-                        'symbol': ticker['symbol'],
-                        'price': float(ticker['lastPrice']),
-                        'volume': volume,
-                        'change_24h': price_change,
-                        'base_asset': ticker['symbol'].replace('USDT', '')
-                    })
-                except:
-                    continue
-        
-        # Sort by volume (highest first) and take top 20
-        usdt_pairs.sort(key=lambda x: x['volume'], reverse=True)
-        trending_coins = usdt_pairs[:20]
-        
-        return jsonify({
+        return ojsonify({
             'success': True,
             'coins': trending_coins
         })
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)})
+        return ojsonify({'success': False, 'error': str(e)})
+
+def parse_float(value):
+    """float(value), or None if it isn't a number"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+def fetch_trending_coins(count=20):
+    """The `count` USDT pairs with the highest 24h quote volume"""
+    # Get 24h ticker data (every pair)
+    tickers = bot_manager.client.client.get_ticker()
+    
+    # Rank the USDT pairs on volume alone - one float() each - and build
+    # the full entries only for the `count` that make the cut
+    volumes = [(parse_float(t.get('quoteVolume')), t) for t in tickers if t['symbol'].endswith('USDT')]
+    ranked = heapq.nlargest(count, [v for v in volumes if v[0] is not None], key=lambda v: v[0])
+    
+    coins = []
+    for volume, ticker in ranked:
+        price = parse_float(ticker.get('lastPrice'))
+        change = parse_float(ticker.get('priceChangePercent'))
+        if price is None or change is None:
+            continue
+        coins.append({
+            'symbol': ticker['symbol'],
+            'price': price,
+            'volume': volume,
+            'change_24h': change,
+            'base_asset': ticker['symbol'][:-4]  # strip the USDT suffix
+        })
+    return coins
 
 @app.route('/api/create-bot', methods=['POST'])
 def api_create_bot():
@@ -495,7 +1459,7 @@ def api_create_bot():
         trade_amount = float(data.get('trade_amount', 50))
         
         if not symbol:
-            return jsonify({'success': False, 'error': 'Symbol is required'})
+            return ojsonify({'success': False, 'error': 'Symbol is required'})
         
         # Create bot
         success, message = bot_manager.create_bot(
@@ -504,54 +1468,109 @@ def api_create_bot():
             strategy=strategy,
             trade_amount=trade_amount
         )
+        invalidate_overview()
         
-        return jsonify({'success': success, 'message': message})
+        return ojsonify({'success': success, 'message': message})
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)})
+        return ojsonify({'success': False, 'error': str(e)})
+
+def bot_action_response(bot_id, success, message):
+    """
+    Result of a start / stop / update, with the bot and totals as they are now
+    
+    The page patches its card from this instead of reloading the overview.
+    """
+    invalidate_overview()
+    data = get_overview()
+    bot = next((b for b in data['bots'] if b['id'] == bot_id), None)
+    return ojsonify({'success': success, 'message': message,
+                     'bot': bot, 'stats': data['stats']})
 
 @app.route('/api/bot/<int:bot_id>/start', methods=['POST'])
 def start_bot(bot_id):
     success, message = bot_manager.start_bot(bot_id)
-    return jsonify({'success': success, 'message': message})
+    return bot_action_response(bot_id, success, message)
 
 @app.route('/api/bot/<int:bot_id>/stop', methods=['POST'])
 def stop_bot(bot_id):
     success, message = bot_manager.stop_bot(bot_id)
-    return jsonify({'success': success, 'message': message})
+    return bot_action_response(bot_id, success, message)
 
 @app.route('/api/bot/<int:bot_id>/details')
 def get_bot_details(bot_id):
-    details = bot_manager.get_bot_details(bot_id)
+    """One bot's details (?logs=N for more than the default recent log lines)"""
+    log_lines = min(max(request.args.get('logs', DETAILS_LOG_LINES, type=int), 1), MAX_LOG_LINES)
+    details = bot_manager.get_bot_details(bot_id, log_lines)
     if details:
-        return jsonify({'success': True, 'data': details})
+        # Streamed: recent_logs / profit_history go out record by record
+        body = iter_json({'success': True, 'data': details})
+        return Response(stream_with_context(body), mimetype='application/json')
     else:
-        return jsonify({'success': False, 'error': 'Bot not found'})
+        return ojsonify({'success': False, 'error': 'Bot not found'})
+
+@app.route('/api/dashboard')
+def dashboard():
+    """Details of every bot in one response"""
+    try:
+        details = {str(bot_id): d for bot_id, d in bot_manager.get_all_bot_details().items()}
+        return Response(stream_with_context(iter_json({'success': True, 'bots': details})),
+                        mimetype='application/json')
+    except Exception as e:
+        return ojsonify({'success': False, 'error': str(e)})
+
+@app.route('/api/bot_tails')
+def bot_tails():
+    """Recent log lines for several bots at once (?ids=1,2,3 - default: all)"""
+    try:
+        ids = request.args.get('ids')
+        if ids:
+            bot_ids = [int(i) for i in ids.split(',') if i.strip()]
+        else:
+            bot_ids = [b['id'] for b in bot_manager.get_bots()]
+        return ojsonify({'success': True, 'tails': bot_manager.get_all_bot_tails(bot_ids)})
+    except Exception as e:
+        return ojsonify({'success': False, 'error': str(e)})
 
 @app.route('/api/bot/<int:bot_id>/update', methods=['POST'])
 def update_bot(bot_id):
     data = request.get_json()
     success, message = bot_manager.update_bot(bot_id, data)
-    return jsonify({'success': success, 'message': message})
+    return bot_action_response(bot_id, success, message)
 
 @app.route('/api/bot/<int:bot_id>/delete', methods=['POST'])
 def delete_bot(bot_id):
     """Delete a bot"""
     success, message = bot_manager.delete_bot(bot_id)
-    return jsonify({'success': success, 'message': message})
+    invalidate_overview()
+    return ojsonify({'success': success, 'message': message})
 
-@app.route('/api/send_alert', methods=['POST'])
-def send_alert():
-    try:
+# One TwilioNotifier for the process (built on the first alert, so twilio
+# stays an optional dependency of the dashboard)
+_notifier = None
+
+def get_notifier():
+    global _notifier
+    if _notifier is None:
         try:
             from archive.twilio_notifier import TwilioNotifier
         except ImportError:
             from twilio_notifier import TwilioNotifier
-        
-        bots = bot_manager.get_bots()
+        _notifier = TwilioNotifier()
+    return _notifier
+
+@app.route('/api/send_alert', methods=['POST'])
+def send_alert():
+    try:
+        # Reuse the dashboard's overview when it's recent (an alert is
+        # usually sent right after a refresh); balances are the background
+        # snapshot, so neither needs a fresh Binance call or screen scan
+        overview_data = get_overview(max_age=ALERT_SNAPSHOT_MAX_AGE)
+        bots = overview_data['bots']
+        stats = overview_data['stats']
         account = bot_manager.get_account_info()
         
-        total_trades = sum(b.get('trades', 0) for b in bots)
-        total_profit = sum(b.get('profit', 0) for b in bots)
+        total_trades = stats['total_trades']
+        total_profit = stats['total_profit']
         running_bots = [b for b in bots if b['status'] == 'running']
         
         positions = [b['symbol'].replace('USDT', '') for b in running_bots]
@@ -565,1042 +1584,57 @@ def send_alert():
             'total_profit': total_profit,
             'profit_percent': 0.0,
             'current_positions': positions,
-            'account_value': account['usdt_total'] if account else 0
+            'account_value': account.get('usdt_total', 0) if account else 0
         }
         
-        notifier = TwilioNotifier()
-        result = notifier.send_summary(summary_data)
+        result = get_notifier().send_summary(summary_data)
         
-        return jsonify({'success': True if result else False, 'message': 'Alert sent!'})
+        return ojsonify({'success': True if result else False, 'message': 'Alert sent!'})
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)})
-
-HTML = '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Trading Dashboard</title>
-    <script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js"></script>
-    <script src="https://cdn.jsdelivr.net/npm/chartjs-adapter-date-fns@3.0.0/dist/chartjs-adapter-date-fns.bundle.min.js"></script>
-    <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }
-        
-        .container {
-            max-width: 1400px;
-            margin: 0 auto;
-        }
-        
-        .header {
-            background: rgba(255, 255, 255, 0.95);
-            padding: 20px 30px;
-            border-radius: 12px;
-            margin-bottom: 20px;
-            box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }
-        
-        .header h1 {
-            font-size: 28px;
-            background: linear-gradient(135deg, #667eea, #764ba2);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-        }
-        
-        .header-actions {
-            display: flex;
-            gap: 10px;
-        }
-        
-        .btn {
-            padding: 10px 20px;
-            border: none;
-            border-radius: 8px;
-            font-size: 14px;
-            font-weight: 600;
-            cursor: pointer;
-            transition: all 0.3s;
-        }
-        
-        .btn-primary {
-            background: linear-gradient(135deg, #667eea, #764ba2);
-            color: white;
-        }
-        
-        .btn-primary:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 4px 12px rgba(102,126,234,0.4);
-        }
-        
-        .btn-secondary {
-            background: white;
-            color: #667eea;
-            border: 2px solid #667eea;
-        }
-        
-        .btn-secondary:hover {
-            background: #667eea;
-            color: white;
-        }
-        
-        .grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-            gap: 20px;
-            margin-bottom: 20px;
-        }
-        
-        .card {
-            background: rgba(255, 255, 255, 0.95);
-            border-radius: 12px;
-            padding: 24px;
-            box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-        }
-        
-        .card-title {
-            font-size: 16px;
-            color: #666;
-            margin-bottom: 8px;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-        }
-        
-        .card-value {
-            font-size: 36px;
-            font-weight: 700;
-            background: linear-gradient(135deg, #667eea, #764ba2);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-        }
-        
-        .card-subtitle {
-            font-size: 14px;
-            color: #999;
-            margin-top: 4px;
-        }
-        
-        .chart-card {
-            background: rgba(255, 255, 255, 0.95);
-            border-radius: 12px;
-            padding: 24px;
-            box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-            margin-bottom: 20px;
-        }
-        
-        .chart-title {
-            font-size: 18px;
-            font-weight: 600;
-            margin-bottom: 20px;
-            color: #333;
-        }
-        
-        .chart-container {
-            position: relative;
-            height: 300px;
-            width: 100%;
-        }
-        
-        .bots-section {
-            background: rgba(255, 255, 255, 0.95);
-            border-radius: 12px;
-            padding: 24px;
-            box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-        }
-        
-        .section-title {
-            font-size: 20px;
-            font-weight: 600;
-            margin-bottom: 20px;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }
-        
-        .bot-card {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            border-radius: 12px;
-            padding: 20px;
-            margin-bottom: 15px;
-            color: white;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }
-        
-        .bot-info {
-            flex: 1;
-        }
-        
-        .bot-name {
-            font-size: 18px;
-            font-weight: 600;
-            margin-bottom: 5px;
-        }
-        
-        .bot-details {
-            font-size: 14px;
-            opacity: 0.9;
-        }
-        
-        .bot-stats {
-            display: flex;
-            gap: 20px;
-            align-items: center;
-        }
-        
-        .bot-stat {
-            text-align: center;
-        }
-        
-        .bot-stat-label {
-            font-size: 11px;
-            opacity: 0.8;
-            text-transform: uppercase;
-        }
-        
-        .bot-stat-value {
-            font-size: 20px;
-            font-weight: 700;
-        }
-        
-        .bot-actions {
-            display: flex;
-            gap: 8px;
-        }
-        
-        .btn-sm {
-            padding: 8px 16px;
-            font-size: 12px;
-        }
-        
-        .btn-success {
-            background: #4caf50;
-            color: white;
-        }
-        
-        .btn-danger {
-            background: #f44336;
-            color: white;
-        }
-        
-        .status-badge {
-            display: inline-block;
-            padding: 4px 12px;
-            border-radius: 12px;
-            font-size: 11px;
-            font-weight: 600;
-            text-transform: uppercase;
-        }
-        
-        .status-running {
-            background: #4caf50;
-            color: white;
-        }
-        
-        .status-stopped {
-            background: rgba(255,255,255,0.3);
-            color: white;
-        }
-        
-        .empty-state {
-            text-align: center;
-            padding: 60px 20px;
-            color: #999;
-        }
-        
-        /* Modal Styles */
-        .modal {
-            display: none;
-            position: fixed;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            background: rgba(0,0,0,0.7);
-            z-index: 1000;
-            align-items: center;
-            justify-content: center;
-        }
-        
-        .modal-content {
-            background: white;
-            border-radius: 12px;
-            padding: 0;
-            max-width: 700px;
-            width: 90%;
-            max-height: 90vh;
-            overflow-y: auto;
-            box-shadow: 0 10px 40px rgba(0,0,0,0.3);
-        }
-        
-        .modal-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            padding: 20px 24px;
-            border-bottom: 1px solid #eee;
-        }
-        
-        .modal-header h2 {
-            margin: 0;
-            font-size: 20px;
-        }
-        
-        .modal-header h3 {
-            margin: 0 0 12px 0;
-            font-size: 14px;
-            color: #666;
-        }
-        
-        .modal-close {
-            background: none;
-            border: none;
-            font-size: 32px;
-            color: #999;
-            cursor: pointer;
-            line-height: 1;
-            padding: 0;
-            width: 32px;
-            height: 32px;
-        }
-        
-        .modal-close:hover {
-            color: #333;
-        }
-        
-        .modal-body {
-            padding: 24px;
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🚀 Trading Dashboard</h1>
-            <div class="header-actions">
-                <button class="btn btn-secondary" onclick="updateDashboard()">🔄 Refresh</button>
-                <button class="btn btn-success" onclick="showAddCoinModal()">➕ Add Coin</button>
-                <button class="btn btn-primary" onclick="sendAlert()">📱 Send Alert</button>
-            </div>
-        </div>
-        
-        <!-- Stats Cards -->
-        <div class="grid">
-            <div class="card">
-                <div class="card-title">Account Balance</div>
-                <div class="card-value" id="balance">$0.00</div>
-                <div class="card-subtitle">Available: $<span id="available">0.00</span></div>
-            </div>
-            
-            <div class="card">
-                <div class="card-title">Total Profit</div>
-                <div class="card-value" id="profit">$0.00</div>
-                <div class="card-subtitle"><span id="trades">0</span> trades</div>
-            </div>
-            
-            <div class="card">
-                <div class="card-title">Running Bots</div>
-                <div class="card-value" id="running">0</div>
-                <div class="card-subtitle">of <span id="total">0</span> total</div>
-            </div>
-        </div>
-        
-        <!-- Charts -->
-        <div class="chart-card">
-            <div class="chart-title">📈 Performance Overview</div>
-            <div class="chart-container">
-                <canvas id="profitChart"></canvas>
-            </div>
-        </div>
-        
-        <!-- Bots Section -->
-        <div class="bots-section">
-            <div class="section-title">
-                <span>🤖 Active Bots</span>
-            </div>
-            <div id="bots-container">
-                <div class="empty-state">Loading...</div>
-            </div>
-        </div>
-        
-        <!-- Bot Details Modal -->
-        <div id="details-modal" class="modal">
-            <div class="modal-content">
-                <div class="modal-header">
-                    <h2 id="details-bot-name">Bot Details</h2>
-                    <button class="modal-close" onclick="hideDetailsModal()">×</button>
-                </div>
-                <div class="modal-body">
-                    <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 15px; margin-bottom: 20px;">
-                        <div><strong>Symbol:</strong> <span id="details-symbol"></span></div>
-                        <div><strong>Strategy:</strong> <span id="details-strategy"></span></div>
-                        <div><strong>Budget:</strong> <span id="details-budget"></span></div>
-                        <div><strong>Trades:</strong> <span id="details-trades"></span></div>
-                        <div><strong>Profit:</strong> <span id="details-profit"></span></div>
-                        <div><strong>Status:</strong> <span id="details-status"></span></div>
-                    </div>
-                    
-                    <h3>📈 Profit Performance</h3>
-                    <div style="background: white; padding: 15px; border-radius: 6px; margin-bottom: 20px; height: 250px;">
-                        <canvas id="botProfitChart"></canvas>
-                    </div>
-                    
-                    <h3>Current Position</h3>
-                    <div id="details-position" style="background: #f5f5f5; padding: 10px; border-radius: 6px; margin-bottom: 20px; font-family: monospace;"></div>
-                    
-                    <h3>Recent Activity (Last 20 lines)</h3>
-                    <div id="details-logs" style="background: #1e1e1e; color: #00ff00; padding: 12px; border-radius: 6px; max-height: 300px; overflow-y: auto; font-family: monospace; font-size: 11px;"></div>
-                </div>
-            </div>
-        </div>
-        
-        <!-- Edit Bot Modal -->
-        <div id="edit-modal" class="modal">
-            <div class="modal-content" style="max-width: 400px;">
-                <div class="modal-header">
-                    <h2>Edit Bot</h2>
-                    <button class="modal-close" onclick="hideEditModal()">×</button>
-                </div>
-                <div class="modal-body">
-                    <input type="hidden" id="edit-bot-id">
-                    
-                    <div style="margin-bottom: 15px;">
-                        <label style="display: block; margin-bottom: 5px; font-weight: 600;">Bot Name:</label>
-                        <input type="text" id="edit-bot-name" style="width: 100%; padding: 10px; border: 1px solid #ddd; border-radius: 6px;">
-                    </div>
-                    
-                    <div style="margin-bottom: 20px;">
-                        <label style="display: block; margin-bottom: 5px; font-weight: 600;">Trade Amount (USDT):</label>
-                        <input type="number" id="edit-bot-amount" min="1" step="1" style="width: 100%; padding: 10px; border: 1px solid #ddd; border-radius: 6px;">
-                        <small style="color: #666;">How much USDT this bot uses per trade</small>
-                    </div>
-                    
-                    <div style="display: flex; gap: 10px;">
-                        <button class="btn btn-primary" onclick="saveBot()" style="flex: 1;">Save Changes</button>
-                        <button class="btn btn-secondary" onclick="hideEditModal()" style="flex: 1;">Cancel</button>
-                    </div>
-                </div>
-            </div>
-        </div>
-        
-        <!-- Add Coin Modal -->
-        <div id="add-coin-modal" class="modal">
-            <div class="modal-content" style="max-width: 600px;">
-                <div class="modal-header">
-                    <h2>➕ Add New Coin</h2>
-                    <button class="modal-close" onclick="hideAddCoinModal()">×</button>
-                </div>
-                <div class="modal-body">
-                    <div style="margin-bottom: 20px;">
-                        <label style="display: block; margin-bottom: 5px; font-weight: 600;">Search Trending Coins:</label>
-                        <button class="btn btn-secondary" onclick="loadTrendingCoins()" style="width: 100%;">🔍 Load Trending Coins</button>
-                    </div>
-                    
-                    <div id="trending-coins" style="max-height: 300px; overflow-y: auto; margin-bottom: 20px; display: none;">
-                        <!-- Trending coins will be loaded here -->
-                    </div>
-                    
-                    <div style="margin-bottom: 15px;">
-                        <label style="display: block; margin-bottom: 5px; font-weight: 600;">Or Enter Symbol Manually:</label>
-                        <input type="text" id="manual-symbol" placeholder="e.g., BTCUSDT" style="width: 100%; padding: 10px; border: 1px solid #ddd; border-radius: 6px;">
-                    </div>
-                    
-                    <div style="margin-bottom: 15px;">
-                        <label style="display: block; margin-bottom: 5px; font-weight: 600;">Strategy:</label>
-                        <select id="new-bot-strategy" style="width: 100%; padding: 10px; border: 1px solid #ddd; border-radius: 6px;">
-                            <option value="volatile">Volatile Coins (Technical Analysis)</option>
-                            <option value="ticker_news">Ticker News (AI + News)</option>
-                        </select>
-                    </div>
-                    
-                    <div style="margin-bottom: 20px;">
-                        <label style="display: block; margin-bottom: 5px; font-weight: 600;">Trade Amount (USDT):</label>
-                        <input type="number" id="new-bot-amount" min="50" step="10" value="50" style="width: 100%; padding: 10px; border: 1px solid #ddd; border-radius: 6px;">
-                        <small style="color: #666;">Minimum $50 to ensure sellable positions</small>
-                    </div>
-                    
-                    <div style="display: flex; gap: 10px;">
-                        <button class="btn btn-primary" onclick="createBot()" style="flex: 1;">Create Bot</button>
-                        <button class="btn btn-secondary" onclick="hideAddCoinModal()" style="flex: 1;">Cancel</button>
-                    </div>
-                </div>
-            </div>
-        </div>
-    </div>
+        return ojsonify({'success': False, 'error': str(e)})
+
+# The page lives in static/index.html; it is read, minified and compressed
+# once here and index() serves the resulting bytes as-is
+with open(os.path.join(app.static_folder, 'index.html'), encoding='utf-8') as f:
+    HTML = f.read()
+
+def minify_html(html):
+    """
+    Cheap, safe minification for static/index.html
     
-    <script>
-        let profitChart = null;
-        
-        function updateDashboard() {
-            fetch('/api/overview')
-                .then(r => r.json())
-                .then(data => {
-                    if (!data.success) return;
-                    
-                    // Update stats
-                    document.getElementById('balance').textContent = '$' + (data.account?.usdt_total || 0).toFixed(2);
-                    document.getElementById('available').textContent = (data.account?.usdt_free || 0).toFixed(2);
-                    document.getElementById('profit').textContent = '$' + (data.stats.total_profit || 0).toFixed(2);
-                    document.getElementById('trades').textContent = data.stats.total_trades;
-                    document.getElementById('running').textContent = data.stats.running_bots;
-                    document.getElementById('total').textContent = data.stats.total_bots;
-                    
-                    // Update chart
-                    updateChart(data.bots);
-                    
-                    // Update bots list
-                    renderBots(data.bots);
-                })
-                .catch(e => console.error(e));
-        }
-        
-        function updateChart(bots) {
-            const ctx = document.getElementById('profitChart').getContext('2d');
-            
-            if (profitChart) {
-                profitChart.destroy();
-            }
-            
-            // Create cumulative profit data for each bot
-            const now = new Date();
-            const datasets = bots.map((bot, index) => {
-                const colors = [
-                    'rgb(102, 126, 234)',
-                    'rgb(118, 75, 162)',
-                    'rgb(76, 175, 80)',
-                    'rgb(255, 193, 7)',
-                    'rgb(244, 67, 54)',
-                    'rgb(33, 150, 243)',
-                    'rgb(156, 39, 176)',
-                    'rgb(255, 87, 34)'
-                ];
-                const color = colors[index % colors.length];
-                
-                return {
-                    label: bot.symbol.replace('USDT', ''),
-                    data: [{
-                        x: new Date(now.getTime() - 3600000),
-                        y: 0
-                    }, {
-                        x: now,
-                        y: bot.profit || 0
-                    }],
-                    borderColor: color,
-                    backgroundColor: color.replace('rgb', 'rgba').replace(')', ', 0.1)'),
-                    tension: 0.4,
-                    fill: true,
-                    pointRadius: 4,
-                    pointHoverRadius: 6
-                };
-            });
-            
-            profitChart = new Chart(ctx, {
-                type: 'line',
-                data: { datasets: datasets },
-                options: {
-                    responsive: true,
-                    maintainAspectRatio: false,
-                    interaction: {
-                        mode: 'nearest',
-                        axis: 'x',
-                        intersect: false
-                    },
-                    plugins: {
-                        legend: {
-                            display: true,
-                            position: 'top'
-                        },
-                        tooltip: {
-                            callbacks: {
-                                label: function(context) {
-                                    return context.dataset.label + ': $' + context.parsed.y.toFixed(2);
-                                }
-                            }
-                        }
-                    },
-                    scales: {
-                        x: {
-                            type: 'time',
-                            time: {
-                                unit: 'hour',
-                                displayFormats: {
-                                    hour: 'HH:mm'
-                                }
-                            },
-                            title: {
-                                display: true,
-                                text: 'Time'
-                            },
-                            grid: { color: 'rgba(0,0,0,0.05)' }
-                        },
-                        y: {
-                            beginAtZero: true,
-                            title: {
-                                display: true,
-                                text: 'Profit ($)'
-                            },
-                            grid: { color: 'rgba(0,0,0,0.05)' },
-                            ticks: {
-                                callback: function(value) {
-                                    return '$' + value.toFixed(0);
-                                }
-                            }
-                        }
-                    }
-                }
-            });
-        }
-        
-        function renderBots(bots) {
-            const container = document.getElementById('bots-container');
-            
-            if (bots.length === 0) {
-                container.innerHTML = '<div class="empty-state">No bots yet</div>';
-                return;
-            }
-            
-            container.innerHTML = bots.map(bot => `
-                <div class="bot-card" data-bot-id="${bot.id}" data-last-check="${bot.last_check || ''}">
-                    <div class="bot-info">
-                        <div class="bot-name">
-                            ${bot.name} 
-                            <span class="status-badge status-${bot.status}">${bot.status}</span>
-                        </div>
-                        <div class="bot-details">
-                            ${bot.symbol} • ${bot.strategy.toUpperCase()}
-                            ${bot.status === 'running' ? `<br><small style="color: rgba(255,255,255,0.7);">⏱️ Next check: <span class="next-check-timer" id="timer-${bot.id}">calculating...</span></small>` : ''}
-                        </div>
-                    </div>
-                    
-                    <div class="bot-stats">
-                        <div class="bot-stat">
-                            <div class="bot-stat-label">Budget</div>
-                            <div class="bot-stat-value">$${(bot.trade_amount || 0).toFixed(0)}</div>
-                        </div>
-                        <div class="bot-stat">
-                            <div class="bot-stat-label">Trades</div>
-                            <div class="bot-stat-value">${bot.trades || 0}</div>
-                        </div>
-                        <div class="bot-stat">
-                            <div class="bot-stat-label">P&L</div>
-                            <div class="bot-stat-value">$${(bot.profit || 0).toFixed(2)}</div>
-                        </div>
-                    </div>
-                    
-                    <div class="bot-actions">
-                        <button class="btn btn-sm" style="background: #667eea;" onclick="showBotDetails(${bot.id})">View</button>
-                        <button class="btn btn-sm" style="background: #f0ad4e;" onclick="showEditBot(${bot.id})">Edit</button>
-                        ${bot.status === 'running' ? 
-                            `<button class="btn btn-sm btn-danger" onclick="stopBot(${bot.id})">Stop</button>` :
-                            `<button class="btn btn-sm btn-success" onclick="startBot(${bot.id})">Start</button>`
-                        }
-                        <button class="btn btn-sm" style="background: #dc3545;" onclick="deleteBot(${bot.id})">🗑️</button>
-                    </div>
-                </div>
-            `).join('');
-            
-            // Start updating countdowns
-            updateCountdowns();
-        }
-        
-        function updateCountdowns() {
-            const cards = document.querySelectorAll('.bot-card');
-            
-            cards.forEach(card => {
-                const botId = card.getAttribute('data-bot-id');
-                const lastCheck = card.getAttribute('data-last-check');
-                const timerElem = document.getElementById(`timer-${botId}`);
-                
-                // Debug logging
-                if (timerElem) {
-                    if (!lastCheck) {
-                        timerElem.textContent = 'no data';
-                        timerElem.style.color = '#ff9800';
-                        return;
-                    }
-                }
-                
-                if (!timerElem || !lastCheck) return;
-                
-                try {
-                    // Parse timestamp from logs (in server's local time)
-                    // Format: "2025-10-24 14:30:45"
-                    const lastCheckDate = new Date(lastCheck.replace(',', '.'));
-                    
-                    // Calculate next check (15 minutes later)
-                    const nextCheckDate = new Date(lastCheckDate.getTime() + (15 * 60 * 1000));
-                    const now = new Date();
-                    
-                    const diff = nextCheckDate - now;
-                    
-                    if (diff <= 0) {
-                        timerElem.textContent = 'checking now...';
-                        timerElem.style.color = '#4caf50';
-                    } else {
-                        const minutes = Math.floor(diff / 60000);
-                        const seconds = Math.floor((diff % 60000) / 1000);
-                        timerElem.textContent = `${minutes}:${seconds.toString().padStart(2, '0')}`;
-                        timerElem.style.color = 'rgba(255,255,255,0.9)';
-                    }
-                } catch (e) {
-                    console.log('Timer error:', e, 'for lastCheck:', lastCheck);
-                    timerElem.textContent = 'parsing error';
-                    timerElem.style.color = '#ff9800';
-                }
-            });
-        }
-        
-        // Update countdowns every second
-        setInterval(updateCountdowns, 1000);
-        
-        function startBot(id) {
-            const btn = event.target;
-            btn.disabled = true;
-            btn.textContent = 'Starting...';
-            
-            fetch(`/api/bot/${id}/start`, { method: 'POST' })
-                .then(r => r.json())
-                .then(data => {
-                    if (!data.success) {
-                        alert('Failed to start bot: ' + data.message);
-                        btn.disabled = false;
-                        btn.textContent = 'Start';
-                    } else {
-                        setTimeout(() => updateDashboard(), 1500);
-                    }
-                })
-                .catch(e => {
-                    alert('Error: ' + e);
-                    btn.disabled = false;
-                    btn.textContent = 'Start';
-                });
-        }
-        
-        function stopBot(id) {
-            const btn = event.target;
-            btn.disabled = true;
-            btn.textContent = 'Stopping...';
-            
-            fetch(`/api/bot/${id}/stop`, { method: 'POST' })
-                .then(r => r.json())
-                .then(data => {
-                    setTimeout(() => updateDashboard(), 1000);
-                })
-                .catch(e => {
-                    btn.disabled = false;
-                    btn.textContent = 'Stop';
-                });
-        }
-        
-        function sendAlert() {
-            if (confirm('Send trading alert SMS now?')) {
-                fetch('/api/send_alert', { method: 'POST' })
-                    .then(r => r.json())
-                    .then(data => {
-                        alert(data.success ? '✅ Alert sent!' : '❌ Error: ' + data.error);
-                    });
-            }
-        }
-        
-        function deleteBot(id) {
-            if (confirm('Delete this bot? This will stop it and remove all data.')) {
-                fetch(`/api/bot/${id}/delete`, { method: 'POST' })
-                    .then(r => r.json())
-                    .then(data => {
-                        if (data.success) {
-                            alert('✅ Bot deleted!');
-                            updateDashboard();
-                        } else {
-                            alert('❌ Error: ' + data.message);
-                        }
-                    })
-                    .catch(e => alert('Error: ' + e));
-            }
-        }
-        
-        // Bot details modal
-        let botDetailChart = null;
-        
-        function showBotDetails(id) {
-            fetch(`/api/bot/${id}/details`)
-                .then(r => r.json())
-                .then(data => {
-                    if (!data.success) return alert('Error loading bot details');
-                    
-                    const bot = data.data.bot;
-                    const logs = data.data.recent_logs;
-                    const position = data.data.position_info;
-                    const profitHistory = data.data.profit_history || [];
-                    
-                    document.getElementById('details-bot-name').textContent = bot.name;
-                    document.getElementById('details-symbol').textContent = bot.symbol;
-                    document.getElementById('details-strategy').textContent = bot.strategy.toUpperCase();
-                    document.getElementById('details-budget').textContent = '$' + (bot.trade_amount || 0).toFixed(2);
-                    document.getElementById('details-trades').textContent = bot.trades || 0;
-                    document.getElementById('details-profit').textContent = '$' + (bot.profit || 0).toFixed(2);
-                    document.getElementById('details-status').textContent = bot.status.toUpperCase();
-                    
-                    document.getElementById('details-position').textContent = position || 'No active position';
-                    
-                    const logsHtml = logs.length > 0 ? 
-                        logs.map(l => `<div style="padding: 4px 0; font-size: 12px; font-family: monospace;">${l}</div>`).join('') :
-                        '<div>No logs available</div>';
-                    document.getElementById('details-logs').innerHTML = logsHtml;
-                    
-                    // Render bot profit chart
-                    renderBotChart(profitHistory, bot.name);
-                    
-                    document.getElementById('details-modal').style.display = 'flex';
-                });
-        }
-        
-        function renderBotChart(profitHistory, botName) {
-            const ctx = document.getElementById('botProfitChart').getContext('2d');
-            
-            if (botDetailChart) {
-                botDetailChart.destroy();
-            }
-            
-            if (profitHistory.length === 0) {
-                // No data yet
-                ctx.font = '14px sans-serif';
-                ctx.fillStyle = '#999';
-                ctx.textAlign = 'center';
-                ctx.fillText('No trade history yet', ctx.canvas.width / 2, ctx.canvas.height / 2);
-                return;
-            }
-            
-            // Calculate cumulative profit
-            let cumulative = 0;
-            const chartData = profitHistory.map(item => {
-                cumulative += item.profit;
-                return {
-                    x: new Date(item.time),
-                    y: cumulative
-                };
-            });
-            
-            botDetailChart = new Chart(ctx, {
-                type: 'line',
-                data: {
-                    datasets: [{
-                        label: 'Cumulative Profit',
-                        data: chartData,
-                        borderColor: 'rgb(102, 126, 234)',
-                        backgroundColor: 'rgba(102, 126, 234, 0.1)',
-                        tension: 0.4,
-                        fill: true,
-                        pointRadius: 3,
-                        pointHoverRadius: 5
-                    }]
-                },
-                options: {
-                    responsive: true,
-                    maintainAspectRatio: false,
-                    plugins: {
-                        legend: { display: false },
-                        title: {
-                            display: true,
-                            text: `${botName} - Profit Over Time`
-                        },
-                        tooltip: {
-                            callbacks: {
-                                label: function(context) {
-                                    return 'Profit: $' + context.parsed.y.toFixed(2);
-                                }
-                            }
-                        }
-                    },
-                    scales: {
-                        x: {
-                            type: 'time',
-                            time: {
-                                unit: 'day',
-                                displayFormats: {
-                                    day: 'MMM d',
-                                    hour: 'HH:mm'
-                                }
-                            },
-                            title: {
-                                display: true,
-                                text: 'Time'
-                            }
-                        },
-                        y: {
-                            beginAtZero: true,
-                            title: {
-                                display: true,
-                                text: 'Cumulative Profit ($)'
-                            },
-                            ticks: {
-                                callback: function(value) {
-                                    return '$' + value.toFixed(2);
-                                }
-                            }
-                        }
-                    }
-                }
-            });
-        }
-        
-        function hideDetailsModal() {
-            document.getElementById('details-modal').style.display = 'none';
-        }
-        
-        // Edit bot modal
-        function showEditBot(id) {
-            fetch(`/api/bot/${id}/details`)
-                .then(r => r.json())
-                .then(data => {
-                    if (!data.success) return alert('Error loading bot');
-                    
-                    const bot = data.data.bot;
-                    document.getElementById('edit-bot-id').value = bot.id;
-                    document.getElementById('edit-bot-name').value = bot.name;
-                    document.getElementById('edit-bot-amount').value = bot.trade_amount || 0;
-                    
-                    document.getElementById('edit-modal').style.display = 'flex';
-                });
-        }
-        
-        function hideEditModal() {
-            document.getElementById('edit-modal').style.display = 'none';
-        }
-        
-        function saveBot() {
-            const id = document.getElementById('edit-bot-id').value;
-            const name = document.getElementById('edit-bot-name').value;
-            const amount = parseFloat(document.getElementById('edit-bot-amount').value);
-            
-            if (!name || amount <= 0) {
-                return alert('Please enter valid values');
-            }
-            
-            fetch(`/api/bot/${id}/update`, {
-                method: 'POST',
-                headers: {'Content-Type': 'application/json'},
-                body: JSON.stringify({
-                    name: name,
-                    trade_amount: amount
-                })
-            })
-            .then(r => r.json())
-            .then(data => {
-                if (data.success) {
-                    hideEditModal();
-                    updateDashboard();
-                } else {
-                    alert('Error: ' + data.message);
-                }
-            });
-        }
-        
-        // Add Coin Modal Functions
-        function showAddCoinModal() {
-            document.getElementById('add-coin-modal').style.display = 'flex';
-        }
-        
-        function hideAddCoinModal() {
-            document.getElementById('add-coin-modal').style.display = 'none';
-            document.getElementById('trending-coins').style.display = 'none';
-            document.getElementById('trending-coins').innerHTML = '';
-        }
-        
-        function loadTrendingCoins() {
-            fetch('/api/search-coins')
-                .then(r => r.json())
-                .then(data => {
-                    if (!data.success) {
-                        alert('Error loading coins: ' + data.error);
-                        return;
-                    }
-                    
-                    const container = document.getElementById('trending-coins');
-                    container.innerHTML = data.coins.map(coin => `
-                        <div class="coin-item" onclick="selectCoin('${coin.symbol}')" style="
-                            display: flex; justify-content: space-between; align-items: center; 
-                            padding: 10px; border: 1px solid #ddd; border-radius: 6px; 
-                            margin-bottom: 8px; cursor: pointer; background: #f9f9f9;
-                        ">
-                            <div>
-                                <strong>${coin.symbol}</strong>
-                                <br><small>${coin.base_asset} • $${coin.price.toFixed(4)}</small>
-                            </div>
-                            <div style="text-align: right;">
-                                <div style="color: ${coin.change_24h >= 0 ? '#4caf50' : '#f44336'};">
-                                    ${coin.change_24h >= 0 ? '+' : ''}${coin.change_24h.toFixed(2)}%
-                                </div>
-                                <small>Vol: $${(coin.volume / 1000000).toFixed(1)}M</small>
-                            </div>
-                        </div>
-                    `).join('');
-                    
-                    container.style.display = 'block';
-                });
-        }
-        
-        function selectCoin(symbol) {
-            document.getElementById('manual-symbol').value = symbol;
-            document.getElementById('trending-coins').style.display = 'none';
-        }
-        
-        function createBot() {
-            const symbol = document.getElementById('manual-symbol').value.trim().toUpperCase();
-            const strategy = document.getElementById('new-bot-strategy').value;
-            const amount = parseFloat(document.getElementById('new-bot-amount').value);
-            
-            if (!symbol) {
-                return alert('Please enter a symbol (e.g., BTCUSDT)');
-            }
-            
-            if (amount < 50) {
-                return alert('Minimum trade amount is $50');
-            }
-            
-            fetch('/api/create-bot', {
-                method: 'POST',
-                headers: {'Content-Type': 'application/json'},
-                body: JSON.stringify({
-                    symbol: symbol,
-                    strategy: strategy,
-                    trade_amount: amount
-                })
-            })
-            .then(r => r.json())
-            .then(data => {
-                if (data.success) {
-                    hideAddCoinModal();
-                    updateDashboard();
-                    alert('Bot created successfully!');
-                } else {
-                    alert('Error: ' + (data.message || data.error || 'Unknown error'));
-                }
-            })
-            .catch(error => {
-                console.error('Create bot error:', error);
-                alert('Network error: ' + error.message);
-            });
-        }
-        
-        // Auto-refresh every 30 seconds
-        setInterval(updateDashboard, 30000);
-        
-        // Initial load
-        updateDashboard();
-    </script>
-</body>
-</html>
-'''
+    Drops HTML comments, indentation and blank lines. Line breaks are kept,
+    so inline JS relying on automatic semicolons still parses (the page has
+    no <pre>/<textarea> content whose whitespace matters).
+    """
+    html = re.sub(r'<!--.*?-->', '', html, flags=re.DOTALL)
+    return '\n'.join(line.strip() for line in html.splitlines() if line.strip())
+
+
+def use_local_vendor_scripts(html):
+    """Point the CDN chart script URLs at /vendor/ for every file we have locally"""
+    for name, url in VENDOR_SCRIPTS.items():
+        if os.path.isfile(os.path.join(VENDOR_DIR, name)):
+            html = html.replace(url, '/vendor/' + name)
+    return html
+
+
+# Minify, encode and compress the page once
+HTML_BYTES = minify_html(use_local_vendor_scripts(HTML)).encode('utf-8')
+HTML_ETAG = hashlib.sha1(HTML_BYTES).hexdigest()
+HTML_GZ = gzip.compress(HTML_BYTES, 9)
+HTML_BR = brotli.compress(HTML_BYTES, quality=11) if brotli is not None else None
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5001, debug=False)
+    try:
+        from waitress import serve
+    except ImportError:
+        serve = None
+    if serve is not None:
+        # Multi-threaded with keep-alive. Each open /api/events stream holds
+        # a thread (waitress can't do WebSockets, so pages use SSE here),
+        # hence the generous thread count.
+        serve(app, host='0.0.0.0', port=5001, threads=32,
+              connection_limit=200, channel_timeout=120)
+    else:
+        app.run(host='0.0.0.0', port=5001, debug=False, threaded=True)
 
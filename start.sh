@@ -54,6 +54,17 @@ fi
 echo "✅ Dependencies OK"
 echo ""
 
+# Self-host the dashboard's chart scripts (falls back to the CDN if this fails)
+mkdir -p static/vendor
+if [ ! -f static/vendor/chart-4.4.0.umd.min.js ]; then
+    curl -fsSL -o static/vendor/chart-4.4.0.umd.min.js \
+        https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js || rm -f static/vendor/chart-4.4.0.umd.min.js
+fi
+if [ ! -f static/vendor/chartjs-adapter-date-fns-3.0.0.bundle.min.js ]; then
+    curl -fsSL -o static/vendor/chartjs-adapter-date-fns-3.0.0.bundle.min.js \
+        https://cdn.jsdelivr.net/npm/chartjs-adapter-date-fns@3.0.0/dist/chartjs-adapter-date-fns.bundle.min.js || rm -f static/vendor/chartjs-adapter-date-fns-3.0.0.bundle.min.js
+fi
+
 # Start the dashboard
 echo "🚀 Starting dashboard on http://localhost:5001"
 echo ""
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test parsing of streamed / cut-short AI answers (no OpenAI calls)
+"""
+import sys
+import os
+from types import SimpleNamespace
+sys.path.insert(0, os.path.dirname(__file__))
+
+import scrape_and_decide_bnb
+from scrape_and_decide_bnb import _read_stream, _parse_response
+
+
+class FakeStream:
+    """Stands in for an OpenAI completion stream"""
+    def __init__(self, pieces):
+        self.pieces = pieces
+        self.closed = False
+    
+    def __iter__(self):
+        for piece in self.pieces:
+            delta = SimpleNamespace(content=piece)
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+    
+    def close(self):
+        self.closed = True
+
+
+def test_early_stop_mid_score():
+    # Decision and the first digit of "42" arrive together; stopping there
+    # must not report a score of 4
+    stream = FakeStream(['{"decision": "HOLD", "score": 4', '2, "reasoning": "meh"}'])
+    text, complete = _read_stream(stream, on_decision=lambda decision: False)
+    result, clean = _parse_response(text)
+    
+    assert stream.closed and not complete and not clean
+    assert result['decision'] == 'HOLD'
+    assert result['score'] == 50
+
+
+def test_truncated_after_score():
+    result, clean = _parse_response('{"decision": "BUY", "score": 42, "reasoning": "Stro')
+    assert not clean
+    assert result['decision'] == 'BUY'
+    assert result['score'] == 42
+
+
+def test_complete_stream():
+    stream = FakeStream(['{"decision": "SELL", ', '"score": 17, ', '"reasoning": "bearish"}'])
+    text, complete = _read_stream(stream)
+    result, clean = _parse_response(text)
+    
+    assert complete and clean
+    assert (result['decision'], result['score'], result['reasoning']) == ('SELL', 17, 'bearish')
+
+
+def test_unparseable_answer_not_cached():
+    # A complete but unusable reply falls back to HOLD/50 without pinning
+    # that fallback in the decision cache
+    stream = FakeStream(['Sorry, I can only answer in prose.'])
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(
+        create=lambda **kwargs: stream)))
+    original = scrape_and_decide_bnb._get_client
+    scrape_and_decide_bnb._get_client = lambda: client
+    scrape_and_decide_bnb._DECISION_CACHE.clear()
+    try:
+        result = scrape_and_decide_bnb.analyze_with_ai([{'url': 'u', 'content': 'BNB to the moon'}])
+    finally:
+        scrape_and_decide_bnb._get_client = original
+    
+    assert (result['decision'], result['score']) == ('HOLD', 50)
+    assert not scrape_and_decide_bnb._DECISION_CACHE
+
+
+def test_invalid_decision_not_clean():
+    result, clean = _parse_response('{"decision": "MAYBE", "score": 70, "reasoning": ""}')
+    assert not clean
+    result, clean = _parse_response('{"decision": "BUY", "reasoning": "no score"}')
+    assert not clean and result['score'] == 50
+
+
+if __name__ == '__main__':
+    test_early_stop_mid_score()
+    test_truncated_after_score()
+    test_complete_stream()
+    test_unparseable_answer_not_cached()
+    test_invalid_decision_not_clean()
+    print("✅ All stream parsing tests passed")
@@ -0,0 +1,18 @@
+"""
+WSGI entry point for the trading dashboard
+==========================================
+
+`python3 simple_dash.py` serves the app with waitress when it is installed
+(Flask's development server otherwise). For a long-running deployment serve
+the same app with gunicorn and a gevent worker, so slow Binance calls yield
+to other requests instead of blocking them:
+
+    gunicorn -k gevent -w 1 --worker-connections 64 -b 0.0.0.0:5001 wsgi:application
+
+Keep it to ONE worker: the bot registry, caches and the background balance
+refresher live in the process.
+
+Author: Trading Bot
+"""
+
+from simple_dash import app as application